@@ -20,7 +20,9 @@ class KNeighborsClassifier(ht.BaseEstimator, ht.ClassificationMixin):
     n_neighbors : int, optional, default: 5
         Number of neighbours to consider when choosing label.
     effective_metric_ : Callable, optional
-        The distance function used to identify the nearest neighbors, defaults to the Euclidean distance.
+        The distance function used to identify the nearest neighbors, defaults to the Euclidean distance. For
+        :func:`ht.spatial.cdist` and :func:`ht.spatial.manhattan`, the neighbors are found with
+        :func:`ht.spatial.cdist_topk` without forming the full distance matrix.
 
     References
     --------
@@ -119,8 +121,16 @@ class KNeighborsClassifier(ht.BaseEstimator, ht.ClassificationMixin):
         x : DNDarray
             The test samples.
         """
-        distances = self.effective_metric_(x, self.x)
-        _, indices = ht.topk(distances, self.n_neighbors, largest=False)
+        # stream the training samples through a running top-k for the built-in metrics,
+        # arbitrary metrics require the full distance matrix
+        metric = {ht.spatial.cdist: "euclidean", ht.spatial.manhattan: "manhattan"}.get(
+            self.effective_metric_
+        )
+        if metric is not None:
+            _, indices = ht.spatial.cdist_topk(x, self.x, self.n_neighbors, metric=metric)
+        else:
+            distances = self.effective_metric_(x, self.x)
+            _, indices = ht.topk(distances, self.n_neighbors, largest=False)
 
         predictions = self.y[indices.flatten()]
         predictions.balance_()
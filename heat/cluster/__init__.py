@@ -6,4 +6,5 @@ from ._kcluster import *
 from .kmeans import *
 from .kmedians import *
 from .kmedoids import *
+from .minibatchkmeans import *
 from .spectral import *
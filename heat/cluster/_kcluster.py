@@ -3,7 +3,8 @@ Base-module for k-clustering algorithms
 """
 
 import heat as ht
-from typing import Optional, Union, Callable
+import torch
+from typing import Optional, Union, Callable, Tuple
 from heat.core.dndarray import DNDarray
 
 
@@ -21,7 +22,7 @@ class _KCluster(ht.ClusteringMixin, ht.BaseEstimator):
     init : str or DNDarray, default: ‘random’
         Method for initialization:
 
-        - ‘probability_based’ : selects initial cluster centers for the clustering in a smart way to speed up convergence (k-means++)
+        - ‘probability_based’ : selects initial cluster centers for the clustering in a smart way to speed up convergence (scalable k-means++, also known as k-means||)
         - ‘random’: choose k observations (rows) at random from data for the initial centroids.
         - ``DNDarray``: gives the initial centers, should be of Shape = (n_clusters, n_features)
     max_iter : int
@@ -98,7 +99,7 @@ class _KCluster(ht.ClusteringMixin, ht.BaseEstimator):
             ht.random.seed(self.random_state)
 
         # initialize the centroids by randomly picking some of the points
-        if self.init == "random":
+        if isinstance(self.init, str) and self.init == "random":
             # Samples will be equally distributed drawn from all involved processes
             _, displ, _ = x.comm.counts_displs_shape(shape=x.shape, axis=0)
             centroids = ht.empty(
@@ -141,50 +142,9 @@ class _KCluster(ht.ClusteringMixin, ht.BaseEstimator):
         # Smart centroid guessing, random sampling with probability weight proportional to distance to existing centroids
         elif self.init == "probability_based":
             if x.split is None or x.split == 0:
-                centroids = ht.zeros(
-                    (self.n_clusters, x.shape[1]), split=None, device=x.device, comm=x.comm
-                )
-                sample = ht.random.randint(0, x.shape[0] - 1).item()
-                _, displ, _ = x.comm.counts_displs_shape(shape=x.shape, axis=0)
-                proc = 0
-                for p in range(x.comm.size):
-                    if displ[p] > sample:
-                        break
-                    proc = p
-                x0 = ht.zeros(x.shape[1], dtype=x.dtype, device=x.device, comm=x.comm)
-                if x.comm.rank == proc:
-                    idx = sample - displ[proc]
-                    x0 = ht.array(x.lloc[idx, :], device=x.device, comm=x.comm)
-                x0.comm.Bcast(x0, root=proc)
-                centroids[0, :] = x0
-                for i in range(1, self.n_clusters):
-                    distances = ht.spatial.distance.cdist(x, centroids, quadratic_expansion=True)
-                    D2 = distances.min(axis=1)
-                    D2.resplit_(axis=None)
-                    prob = D2 / D2.sum()
-                    random_position = ht.random.rand().item()
-                    sample = 0
-                    sum = 0
-                    for j in range(len(prob)):
-                        if sum > random_position:
-                            break
-                        sum += prob[j].item()
-                        sample = j
-                    proc = 0
-                    for p in range(x.comm.size):
-                        if displ[p] > sample:
-                            break
-                        proc = p
-                    xi = ht.zeros(x.shape[1], dtype=x.dtype)
-                    if x.comm.rank == proc:
-                        idx = sample - displ[proc]
-                        xi = ht.array(x.lloc[idx, :], device=x.device, comm=x.comm)
-                    xi.comm.Bcast(xi, root=proc)
-                    centroids[i, :] = xi
-
+                self._cluster_centers = self.__kmeans_parallel(x)
             else:
                 raise NotImplementedError("Not implemented for other splitting-axes")
-            self._cluster_centers = centroids
 
         else:
             raise ValueError(
@@ -193,6 +153,109 @@ class _KCluster(ht.ClusteringMixin, ht.BaseEstimator):
                 )
             )
 
+    def __kmeans_parallel(self, x: DNDarray, rounds: int = 5) -> DNDarray:
+        """
+        Scalable k-means++ (k-means||) initialization [1]. Starting from a single random point, each process samples
+        every local point independently with a probability proportional to its squared distance to the current
+        candidates. The sampled points of all processes are added to the candidates at once. After a few of these
+        oversampling rounds, each candidate is weighted by the number of points closest to it, and the final centroids are
+        picked from the small candidate set by a weighted k-means++.
+
+        Parameters
+        ----------
+        x : DNDarray
+            The data to initialize the clusters for. Shape = (n_samples, n_features), split along the samples or not
+            split at all.
+        rounds : int, optional
+            Number of oversampling rounds, 5 rounds are sufficient in practice [1].
+
+        References
+        ----------
+        [1] Bahmani, B., Moseley, B., Vattani, A., Kumar, R., Vassilvitskii, S., "Scalable k-means++", Proceedings of
+        the VLDB Endowment, 5 (7), pp. 622–633, 2012.
+        """
+        comm = x.comm
+        distributed = x.is_distributed()
+        # same centroid datatype as for the random initialization
+        dtype = ht.float32.torch_type()
+        local_x = x.larray.to(dtype)
+        # expected number of candidates sampled per round
+        oversampling = 2 * self.n_clusters
+
+        # the random state of heat is identical on all processes, use it to seed the local generators
+        seed = ht.random.randint(0, 2**31 - 1).item()
+        shared_generator = torch.Generator().manual_seed(seed)
+        local_generator = torch.Generator().manual_seed(
+            seed + comm.rank + 1 if distributed else seed
+        )
+
+        # first candidate is a random point
+        sample = torch.randint(x.shape[0], (1,), generator=shared_generator).item()
+        candidates = torch.empty((1, x.shape[1]), dtype=dtype, device=local_x.device)
+        if distributed:
+            _, displs = x.counts_displs()
+            proc = next(p for p in range(comm.size - 1, -1, -1) if displs[p] <= sample)
+            if comm.rank == proc:
+                candidates[0] = local_x[sample - displs[proc]]
+            comm.Bcast(candidates, root=proc)
+        else:
+            candidates[0] = local_x[sample]
+        min_distances, closest = _closest_centers(local_x, candidates)
+
+        for _ in range(rounds):
+            cost = min_distances.sum()
+            if distributed:
+                comm.Allreduce(ht.MPI.IN_PLACE, cost, ht.MPI.SUM)
+            if cost == 0:
+                break
+            # sample the local points independently
+            probability = (oversampling * min_distances / cost).clamp(max=1.0)
+            uniform = torch.rand(probability.shape, generator=local_generator, dtype=dtype)
+            new_candidates = local_x[uniform.to(probability.device) < probability]
+            if distributed:
+                counts = comm.allgather(new_candidates.shape[0])
+                displs = [0] + torch.tensor(counts).cumsum(0)[:-1].tolist()
+                gathered = torch.empty(
+                    (sum(counts), x.shape[1]), dtype=dtype, device=local_x.device
+                )
+                comm.Allgatherv(new_candidates, (gathered, counts, displs), recv_axis=0)
+                new_candidates = gathered
+            if new_candidates.shape[0] == 0:
+                continue
+
+            # only the distances to the new candidates are needed
+            new_distances, new_closest = _closest_centers(local_x, new_candidates)
+            closer = new_distances < min_distances
+            min_distances = torch.where(closer, new_distances, min_distances)
+            closest = torch.where(closer, new_closest + candidates.shape[0], closest)
+            candidates = torch.cat((candidates, new_candidates))
+
+        # weight the candidates by the number of points they attract
+        weights = torch.bincount(closest, minlength=candidates.shape[0]).to(dtype)
+        if distributed:
+            comm.Allreduce(ht.MPI.IN_PLACE, weights, ht.MPI.SUM)
+
+        # weighted k-means++ on the candidates, computed on one process to guarantee identical centroids everywhere
+        centroids = torch.empty((self.n_clusters, x.shape[1]), dtype=dtype, device=local_x.device)
+        if comm.rank == 0:
+            sample = torch.multinomial(weights.cpu(), 1, generator=shared_generator).item()
+            centroids[0] = candidates[sample]
+            candidate_distances, _ = _closest_centers(candidates, centroids[:1])
+            for i in range(1, self.n_clusters):
+                probability = weights * candidate_distances
+                if probability.sum() <= 0:
+                    # less distinct candidates than clusters
+                    probability = weights
+                sample = torch.multinomial(probability.cpu(), 1, generator=shared_generator).item()
+                centroids[i] = candidates[sample]
+                candidate_distances = torch.minimum(
+                    candidate_distances, _closest_centers(candidates, centroids[i : i + 1])[0]
+                )
+        if comm.is_distributed():
+            comm.Bcast(centroids, root=0)
+
+        return ht.array(centroids, device=x.device, comm=comm)
+
     def _assign_to_cluster(self, x: DNDarray):
         """
         Assigns the passed data points to the centroids based on the respective metric
@@ -208,6 +271,61 @@ class _KCluster(ht.ClusteringMixin, ht.BaseEstimator):
 
         return matching_centroids
 
+    def _cluster_sums_and_counts(self, x: DNDarray, matching_centroids: DNDarray) -> torch.Tensor:
+        """
+        Accumulates the data points and the number of data points assigned to each cluster in a single pass over the
+        local data. The partial results of all processes are combined with a single ``Allreduce``.
+        Returns a ``torch.Tensor`` of shape ``(n_clusters, n_features + 1)``, the first ``n_features`` columns hold the
+        sum of the assigned points, the last column holds the number of assigned points.
+
+        Parameters
+        ----------
+        x : DNDarray
+            Input data, Shape = (n_samples, n_features)
+        matching_centroids : DNDarray
+            Index array of assigned centroids
+        """
+        dtype = self._cluster_centers.larray.dtype
+        labels = matching_centroids.larray.reshape(-1).to(torch.int64)
+        local_x = x.larray.to(dtype)
+
+        sums_and_counts = torch.zeros(
+            (self.n_clusters, x.shape[1] + 1), dtype=dtype, device=local_x.device
+        )
+        sums_and_counts[:, :-1].index_add_(0, labels, local_x)
+        sums_and_counts[:, -1].index_add_(0, labels, torch.ones_like(labels, dtype=dtype))
+        if x.is_distributed():
+            x.comm.Allreduce(ht.MPI.IN_PLACE, sums_and_counts, ht.MPI.SUM)
+
+        return sums_and_counts
+
+    def _cluster_members(
+        self, x: DNDarray, matching_centroids: DNDarray
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Groups the local data points by their assigned cluster with a single local sort. Returns
+        ``(order, offsets, counts)``: the local row indices of ``x`` sorted by cluster, the offsets of each cluster
+        in ``order`` (the local members of cluster ``i`` are ``order[offsets[i]:offsets[i + 1]]``) and the global number
+        of points assigned to each cluster.
+
+        Parameters
+        ----------
+        x : DNDarray
+            Input data, Shape = (n_samples, n_features)
+        matching_centroids : DNDarray
+            Index array of assigned centroids
+        """
+        labels = matching_centroids.larray.reshape(-1).to(torch.int64)
+        order = torch.argsort(labels)
+
+        counts = torch.bincount(labels, minlength=self.n_clusters)
+        offsets = torch.zeros(self.n_clusters + 1, dtype=torch.int64, device=counts.device)
+        torch.cumsum(counts, dim=0, out=offsets[1:])
+        if x.is_distributed():
+            x.comm.Allreduce(ht.MPI.IN_PLACE, counts, ht.MPI.SUM)
+
+        return order, offsets, counts
+
     def _update_centroids(self, x: DNDarray, matching_centroids: DNDarray):
         """
         The Update strategy is algorithm specific (e.g. calculate mean of assigned points for kmeans, median for kmedians, etc.)
@@ -252,3 +370,33 @@ class _KCluster(ht.ClusteringMixin, ht.BaseEstimator):
 
         # determine the centroids
         return self._assign_to_cluster(x)
+
+
+def _closest_centers(
+    x: torch.Tensor, centers: torch.Tensor, block_size: int = 2**24
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Computes the squared Euclidean distance of each row of ``x`` to its closest row in ``centers`` and the index of that
+    row. ``x`` is processed in blocks of rows, such that the temporary distance matrix has at most ``block_size``
+    elements.
+
+    Parameters
+    ----------
+    x : torch.Tensor
+        Points, Shape = (n_points, n_features)
+    centers : torch.Tensor
+        Centers, Shape = (n_centers, n_features)
+    block_size : int, optional
+        Maximum number of elements of the temporary distance matrix
+    """
+    min_distances = torch.empty(x.shape[0], dtype=x.dtype, device=x.device)
+    closest = torch.empty(x.shape[0], dtype=torch.int64, device=x.device)
+    rows = max(1, block_size // max(1, centers.shape[0]))
+    for start in range(0, x.shape[0], rows):
+        distances = torch.cdist(x[start : start + rows], centers)
+        torch.min(
+            distances,
+            dim=1,
+            out=(min_distances[start : start + rows], closest[start : start + rows]),
+        )
+    return min_distances.square_(), closest
@@ -3,6 +3,8 @@ Module Implementing the Kmeans Algorithm
 """
 from typing import Optional, Union, TypeVar
 
+import torch
+
 import heat as ht
 from heat.cluster._kcluster import _KCluster
 from heat.core.dndarray import DNDarray
@@ -12,7 +14,8 @@ self = TypeVar("self")
 
 class KMeans(_KCluster):
     r"""
-    K-Means clustering algorithm. An implementation of Lloyd's algorithm [1].
+    K-Means clustering algorithm. An implementation of Lloyd's algorithm [1] and of its accelerated variants by
+    Elkan [3] and Hamerly [4].
 
     Attributes
     ----------
@@ -30,6 +33,20 @@ class KMeans(_KCluster):
         Relative tolerance with regards to inertia to declare convergence.
     random_state : int
         Determines random number generation for centroid initialization.
+    algorithm : str
+        K-means algorithm to use:
+
+        - ‘lloyd’ : the classical expectation-maximization algorithm, computes all point-centroid distances in every
+          iteration.
+        - ‘elkan’ : keeps an upper bound and one lower bound per point and centroid as well as the centroid-centroid
+          distances to skip most distance computations once the assignments settle [3]. Needs
+          :math:`O(n \cdot k)` additional memory.
+        - ‘hamerly’ : like ‘elkan’, but keeps only a single lower bound per point [4]. Usually the better choice for
+          a low number of features or a large number of clusters.
+
+        ‘elkan’ and ‘hamerly’ yield the same clustering as ‘lloyd’. They require the data to be split along the
+        samples axis (or not split) and compute the point-centroid distances locally, i.e. the only communication
+        per iteration is the reduction of the centroid update.
 
     Notes
     -----
@@ -48,6 +65,12 @@ class KMeans(_KCluster):
     [2] Arthur, D., Vassilvitskii, S., "k-means++: The Advantages of Careful Seeding", Proceedings of the Eighteenth
     Annual ACM-SIAM Symposium on Discrete Algorithms, Society for Industrial and Applied Mathematics
     Philadelphia, PA, USA. pp. 1027–1035, 2007.
+
+    [3] Elkan, C., "Using the triangle inequality to accelerate k-means", Proceedings of the Twentieth International
+    Conference on Machine Learning, pp. 147–153, 2003.
+
+    [4] Hamerly, G., "Making k-means even faster", Proceedings of the 2010 SIAM International Conference on Data
+    Mining, pp. 130–140, 2010.
     """
 
     def __init__(
@@ -57,9 +80,15 @@ class KMeans(_KCluster):
         max_iter: int = 300,
         tol: float = 1e-4,
         random_state: Optional[int] = None,
+        algorithm: str = "lloyd",
     ):
-        if init == "kmeans++":
+        if isinstance(init, str) and init == "kmeans++":
             init = "probability_based"
+        if algorithm not in ["lloyd", "elkan", "hamerly"]:
+            raise ValueError(
+                f'algorithm needs to be one of "lloyd", "elkan" or "hamerly", but was {algorithm}'
+            )
+        self.algorithm = algorithm
 
         super().__init__(
             metric=lambda x, y: ht.spatial.distance.cdist(x, y, quadratic_expansion=True),
@@ -82,22 +111,14 @@ class KMeans(_KCluster):
             Array filled with indices ``i`` indicating to which cluster ``ci`` each sample point in ``x`` is assigned
 
         """
-        new_cluster_centers = self._cluster_centers.copy()
-        for i in range(self.n_clusters):
-            # points in current cluster
-            selection = (matching_centroids == i).astype(ht.int64)
-            # accumulate points and total number of points in cluster
-            assigned_points = x * selection
-            points_in_cluster = selection.sum(axis=0, keepdims=True).clip(
-                1.0, ht.iinfo(ht.int64).max
-            )
+        # accumulate points and total number of points in each cluster
+        sums_and_counts = self._cluster_sums_and_counts(x, matching_centroids)
+        points_in_cluster = sums_and_counts[:, -1:].clamp(min=1.0)
 
-            # compute the new centroids
-            new_cluster_centers[i : i + 1, :] = (assigned_points / points_in_cluster).sum(
-                axis=0, keepdims=True
-            )
+        # compute the new centroids
+        new_cluster_centers = sums_and_counts[:, :-1] / points_in_cluster
 
-        return new_cluster_centers
+        return ht.array(new_cluster_centers, device=x.device, comm=x.comm)
 
     def fit(self, x: DNDarray) -> self:
         """
@@ -116,6 +137,8 @@ class KMeans(_KCluster):
         # initialize the clustering
         self._initialize_cluster_centers(x)
         self._n_iter = 0
+        if self.algorithm != "lloyd":
+            return self._fit_bounded(x)
         matching_centroids = ht.zeros((x.shape[0]), split=x.split, device=x.device, comm=x.comm)
 
         # iteratively fit the points to the centroids
@@ -137,3 +160,147 @@ class KMeans(_KCluster):
         self._labels = matching_centroids
 
         return self
+
+    def _fit_bounded(self, x: DNDarray) -> self:
+        """
+        Computes the centroids of a k-means clustering with the triangle-inequality accelerated variants of Elkan or
+        Hamerly. The centroids are replicated on all processes, hence the bounds are kept and checked on the local data
+        only.
+
+        Parameters
+        ----------
+        x : DNDarray
+            Training instances to cluster. Shape = (n_samples, n_features)
+        """
+        if x.split is not None and x.split != 0:
+            raise NotImplementedError("Not implemented for other splitting-axes")
+
+        elkan = self.algorithm == "elkan"
+        centers = self._cluster_centers.larray
+        local_x = x.larray.to(centers.dtype)
+
+        # the first assignment computes all distances and initializes the bounds
+        distances = torch.cdist(local_x, centers)
+        upper, labels = distances.min(dim=1)
+        if elkan:
+            lower = distances
+        else:
+            lower = distances.scatter_(1, labels.unsqueeze(1), float("inf")).min(dim=1)[0]
+        del distances
+
+        for epoch in range(self.max_iter):
+            # increment the iteration count
+            self._n_iter += 1
+            if epoch > 0:
+                # the centroid-centroid distances are cheap, the centroids are replicated
+                center_distances = torch.cdist(centers, centers).fill_diagonal_(float("inf"))
+                assign = self.__elkan_assign if elkan else self.__hamerly_assign
+                assign(local_x, centers, labels, upper, lower, center_distances)
+
+            matching_centroids = DNDarray(
+                labels.unsqueeze(1),
+                gshape=(x.shape[0], 1),
+                dtype=ht.int64,
+                split=x.split,
+                device=x.device,
+                comm=x.comm,
+                balanced=x.balanced,
+            )
+
+            # update the centroids
+            new_cluster_centers = self._update_centroids(x, matching_centroids)
+            # check whether centroid movement has converged
+            self._inertia = ((self._cluster_centers - new_cluster_centers) ** 2).sum()
+            self._cluster_centers = new_cluster_centers
+            if self.tol is not None and self._inertia <= self.tol:
+                break
+
+            # move the bounds along with the centroids
+            movement = (new_cluster_centers.larray - centers).norm(dim=1)
+            centers = new_cluster_centers.larray
+            upper += movement[labels]
+            if elkan:
+                lower.sub_(movement).clamp_(min=0.0)
+            elif self.n_clusters > 1:
+                # the lower bound refers to any but the assigned centroid
+                largest, largest_idx = movement.topk(2)
+                lower -= torch.where(labels == largest_idx[0], largest[1], largest[0])
+
+        self._labels = matching_centroids
+
+        return self
+
+    @staticmethod
+    def __elkan_assign(
+        local_x: torch.Tensor,
+        centers: torch.Tensor,
+        labels: torch.Tensor,
+        upper: torch.Tensor,
+        lower: torch.Tensor,
+        center_distances: torch.Tensor,
+    ):
+        """
+        Assignment step of Elkan's algorithm. Updates ``labels``, the upper bounds ``upper`` and the lower bounds
+        ``lower`` (one per point and centroid) in-place.
+        """
+        # points whose upper bound exceeds half the distance to the closest other centroid might change their cluster
+        half_closest = 0.5 * center_distances.min(dim=1)[0]
+        idx = torch.nonzero(upper > half_closest[labels]).squeeze(1)
+        if idx.numel() == 0:
+            return
+        # tighten the upper bounds
+        assigned = labels[idx]
+        tight = (local_x[idx] - centers[assigned]).norm(dim=1)
+        upper[idx] = tight
+        lower[idx, assigned] = tight
+
+        # centroids that can not be ruled out by the lower bounds or the centroid distances
+        candidates = (tight.unsqueeze(1) > lower[idx]) & (
+            tight.unsqueeze(1) > 0.5 * center_distances[assigned]
+        )
+        points, clusters = torch.nonzero(candidates, as_tuple=True)
+        if points.numel() == 0:
+            return
+        distances = (local_x[idx[points]] - centers[clusters]).norm(dim=1)
+        lower[idx[points], clusters] = distances
+
+        # reassign the points to the closest candidate if it is closer than the current centroid
+        candidate_distances = torch.full_like(candidates, float("inf"), dtype=distances.dtype)
+        candidate_distances[points, clusters] = distances
+        closest, closest_idx = candidate_distances.min(dim=1)
+        closer = closest < tight
+        upper[idx[closer]] = closest[closer]
+        labels[idx[closer]] = closest_idx[closer]
+
+    @staticmethod
+    def __hamerly_assign(
+        local_x: torch.Tensor,
+        centers: torch.Tensor,
+        labels: torch.Tensor,
+        upper: torch.Tensor,
+        lower: torch.Tensor,
+        center_distances: torch.Tensor,
+    ):
+        """
+        Assignment step of Hamerly's algorithm. Updates ``labels``, the upper bounds ``upper`` and the lower bounds
+        ``lower`` (one per point) in-place.
+        """
+        # half the distance of each centroid to its closest other centroid
+        half_closest = 0.5 * center_distances.min(dim=1)[0]
+        bound = torch.maximum(half_closest[labels], lower)
+        idx = torch.nonzero(upper > bound).squeeze(1)
+        if idx.numel() == 0:
+            return
+        # tighten the upper bounds
+        upper[idx] = (local_x[idx] - centers[labels[idx]]).norm(dim=1)
+        idx = idx[upper[idx] > bound[idx]]
+        if idx.numel() == 0:
+            return
+
+        # the remaining points need the distances to all centroids
+        distances = torch.cdist(local_x[idx], centers)
+        closest, closest_idx = distances.topk(min(2, centers.shape[0]), dim=1, largest=False)
+        labels[idx] = closest_idx[:, 0]
+        upper[idx] = closest[:, 0]
+        if centers.shape[0] > 1:
+            lower[idx] = closest[:, 1]
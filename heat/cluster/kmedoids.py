@@ -65,18 +65,12 @@ class KMedoids(_KCluster):
             Array filled with indeces ``i`` indicating to which cluster ``ci`` each sample point in ``x`` is assigned
         """
         new_cluster_centers = self._cluster_centers.copy()
+        # group the local points by cluster once, instead of masking all points for every cluster
+        order, offsets, points_in_cluster = self._cluster_members(x, matching_centroids)
         for i in range(self.n_clusters):
-            # points in current cluster
-            selection = (matching_centroids == i).astype(ht.int64)
-            # Remove 0-element lines to avoid spoiling of median
-            assigned_points = x * selection
-            rows = (assigned_points.abs()).sum(axis=1) != 0
-            local = assigned_points.larray[rows._DNDarray__array]
-            clean = ht.array(local, is_split=x.split)
-            clean.balance_()
             # failsafe in case no point is assigned to this cluster
             # draw a random datapoint to continue/restart
-            if clean.shape[0] == 0:
+            if points_in_cluster[i] == 0:
                 _, displ, _ = x.comm.counts_displs_shape(shape=x.shape, axis=0)
                 sample = ht.random.randint(0, x.shape[0]).item()
                 proc = 0
@@ -92,6 +86,10 @@ class KMedoids(_KCluster):
                 new_cluster_centers[i, :] = xi
 
             else:
+                # points in current cluster
+                local = x.larray[order[offsets[i] : offsets[i + 1]]]
+                clean = ht.array(local, is_split=x.split, device=x.device, comm=x.comm)
+                clean.balance_()
                 if clean.shape[0] <= ht.MPI_WORLD.size:
                     clean.resplit_(axis=None)
                 median = ht.median(clean, axis=0, keepdims=True)
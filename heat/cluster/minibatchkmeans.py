@@ -0,0 +1,153 @@
+"""
+Module Implementing the Mini-Batch Kmeans Algorithm
+"""
+from typing import Optional, Union, TypeVar
+
+import torch
+
+import heat as ht
+from heat.cluster._kcluster import _KCluster
+from heat.core.dndarray import DNDarray
+
+self = TypeVar("self")
+
+
+class MiniBatchKMeans(_KCluster):
+    r"""
+    Mini-Batch K-Means clustering algorithm [1]. In every step, each process draws a random mini-batch from its local
+    data and assigns the batch points to their closest centroids. The centroids are then moved towards the mean of their
+    assigned batch points with a per-centroid learning rate that decreases with the number of points assigned so far.
+    The only communication per step is the reduction of the per-cluster sums and counts of the batch.
+
+    Attributes
+    ----------
+    n_clusters : int
+        The number of clusters to form as well as the number of centroids to generate.
+    init : str or DNDarray
+        Method for initialization:
+
+        - ‘k-means++’ : selects initial cluster centers for the clustering in a smart way to speed up convergence [2].
+        - ‘random’: choose k observations (rows) at random from data for the initial centroids.
+        - DNDarray: it should be of shape (n_clusters, n_features) and gives the initial centers.
+    max_iter : int
+        Maximum number of mini-batch steps.
+    batch_size : int
+        Global size of the mini-batches. Each process contributes a share proportional to its number of samples.
+    tol : float
+        Tolerance with regards to the squared centroid movement of a step to declare convergence. ``0.0`` disables the
+        check, the algorithm then runs for ``max_iter`` steps.
+    random_state : int
+        Determines random number generation for centroid initialization and for the mini-batch sampling.
+
+    Notes
+    -----
+    The complexity per step is given by :math:`O(k \cdot b)`, were :math:`b` is the batch size, independent of the
+    number of samples. The centroids are only an approximation of the ones found by :class:`KMeans`. After the last step,
+    ``labels_`` are computed by assigning all samples to the final centroids.
+
+    References
+    ----------
+    [1] Sculley, D., "Web-scale k-means clustering", Proceedings of the 19th International Conference on World Wide
+    Web, pp. 1177–1178, 2010.
+
+    [2] Arthur, D., Vassilvitskii, S., "k-means++: The Advantages of Careful Seeding", Proceedings of the Eighteenth
+    Annual ACM-SIAM Symposium on Discrete Algorithms, Society for Industrial and Applied Mathematics
+    Philadelphia, PA, USA. pp. 1027–1035, 2007.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 8,
+        init: Union[str, DNDarray] = "random",
+        max_iter: int = 100,
+        batch_size: int = 1024,
+        tol: float = 0.0,
+        random_state: Optional[int] = None,
+    ):
+        if isinstance(init, str) and init == "kmeans++":
+            init = "probability_based"
+
+        super().__init__(
+            metric=lambda x, y: ht.spatial.distance.cdist(x, y, quadratic_expansion=True),
+            n_clusters=n_clusters,
+            init=init,
+            max_iter=max_iter,
+            tol=tol,
+            random_state=random_state,
+        )
+        self.batch_size = batch_size
+
+    def fit(self, x: DNDarray) -> self:
+        """
+        Computes the centroids of a mini-batch k-means clustering.
+
+        Parameters
+        ----------
+        x : DNDarray
+            Training instances to cluster. Shape = (n_samples, n_features)
+        """
+        # input sanitation
+        if not isinstance(x, DNDarray):
+            raise ValueError(f"input needs to be a ht.DNDarray, but was {type(x)}")
+        if x.split is not None and x.split != 0:
+            raise NotImplementedError("Not implemented for other splitting-axes")
+        if not isinstance(self.batch_size, int) or self.batch_size < 1:
+            raise ValueError(
+                f"batch_size needs to be a positive integer, but was {self.batch_size}"
+            )
+
+        # initialize the clustering
+        self._initialize_cluster_centers(x)
+        self._n_iter = 0
+
+        # split data: every process samples its own part of the batch
+        # replicated data: all processes draw the same batch
+        seed = self.random_state
+        if seed is None:
+            seed = x.comm.bcast(int(torch.randint(0, 2**31 - 1, (1,)).item()), root=0)
+        local_x = x.larray
+        local_batch_size = self.batch_size
+        if x.is_distributed():
+            seed += x.comm.rank
+            local_batch_size = round(self.batch_size * local_x.shape[0] / x.shape[0])
+        generator = torch.Generator().manual_seed(seed)
+
+        centers = self._cluster_centers.larray.clone()
+        n_features = centers.shape[1]
+        points_seen = torch.zeros(self.n_clusters, dtype=centers.dtype, device=centers.device)
+
+        for epoch in range(self.max_iter):
+            # increment the iteration count
+            self._n_iter += 1
+
+            # draw the local mini-batch and assign it to the closest centroids
+            sample = torch.randint(local_x.shape[0], (local_batch_size,), generator=generator)
+            batch = local_x[sample.to(local_x.device)].to(centers.dtype)
+            labels = torch.cdist(batch, centers).argmin(dim=1)
+
+            # accumulate batch points and number of batch points per cluster
+            sums_and_counts = torch.zeros(
+                (self.n_clusters, n_features + 1), dtype=centers.dtype, device=centers.device
+            )
+            sums_and_counts[:, :-1].index_add_(0, labels, batch)
+            sums_and_counts[:, -1].index_add_(0, labels, torch.ones_like(labels, dtype=batch.dtype))
+            if x.is_distributed():
+                x.comm.Allreduce(ht.MPI.IN_PLACE, sums_and_counts, ht.MPI.SUM)
+
+            # move the centroids towards the batch means, the learning rate decays per centroid
+            batch_counts = sums_and_counts[:, -1]
+            points_seen += batch_counts
+            batch_means = sums_and_counts[:, :-1] / batch_counts.clamp(min=1.0).unsqueeze(1)
+            learning_rate = (batch_counts / points_seen.clamp(min=1.0)).unsqueeze(1)
+            new_centers = centers + learning_rate * (batch_means - centers)
+
+            # check whether centroid movement has converged
+            self._inertia = ((new_centers - centers) ** 2).sum().item()
+            centers = new_centers
+            if self.tol is not None and self._inertia <= self.tol:
+                break
+
+        self._cluster_centers = ht.array(centers, device=x.device, comm=x.comm)
+        self._labels = self._assign_to_cluster(x)
+
+        return self
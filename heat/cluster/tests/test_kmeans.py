@@ -20,7 +20,14 @@ class TestKMeans(TestCase):
 
         self.assertEqual(
             params,
-            {"n_clusters": 8, "init": "random", "max_iter": 300, "tol": 1e-4, "random_state": None},
+            {
+                "n_clusters": 8,
+                "init": "random",
+                "max_iter": 300,
+                "tol": 1e-4,
+                "random_state": None,
+                "algorithm": "lloyd",
+            },
         )
 
         params["n_clusters"] = 10
@@ -63,6 +70,11 @@ class TestKMeans(TestCase):
         with self.assertRaises(ValueError):
             kmeans = ht.cluster.KMeans(n_clusters=k, init="random_number")
             kmeans.fit(iris_split)
+        with self.assertRaises(ValueError):
+            ht.cluster.KMeans(n_clusters=k, algorithm="fast")
+        with self.assertRaises(NotImplementedError):
+            init = ht.zeros((k, iris_split.shape[1]))
+            ht.cluster.KMeans(n_clusters=k, init=init, algorithm="elkan").fit(iris_split)
 
     def test_spherical_clusters(self):
         seed = 1
@@ -103,3 +115,79 @@ class TestKMeans(TestCase):
         kmeans.fit(data)
         self.assertIsInstance(kmeans.cluster_centers_, ht.DNDarray)
         self.assertEqual(kmeans.cluster_centers_.shape, (4, 3))
+
+    def test_update_centroids(self):
+        n = 10 * ht.MPI_WORLD.size
+        x = ht.random.randn(n, 3, split=0)
+        labels = ht.arange(n, split=0) % 4
+        # cluster 3 stays empty
+        labels[labels == 3] = 0
+        kmeans = ht.cluster.KMeans(n_clusters=4)
+        kmeans._cluster_centers = ht.zeros((4, 3))
+        new_centers = kmeans._update_centroids(x, labels.expand_dims(1))
+        self.assertIsInstance(new_centers, ht.DNDarray)
+        self.assertIsNone(new_centers.split)
+
+        x_np = x.numpy()
+        labels_np = labels.numpy()
+        for i in range(3):
+            expected = x_np[labels_np == i].mean(axis=0)
+            self.assertTrue(np.allclose(new_centers[i].numpy(), expected, atol=1e-6))
+        self.assertTrue((new_centers[3] == 0).all())
+
+    def test_accelerated_algorithms(self):
+        seed = 1
+        n = 20 * ht.MPI_WORLD.size
+        data = create_spherical_dataset(
+            num_samples_cluster=n, radius=1.0, offset=4.0, dtype=ht.float64, random_state=seed
+        )
+        init = data[:: data.shape[0] // 6][:6].resplit_(None)
+        lloyd = ht.cluster.KMeans(n_clusters=6, init=init, tol=1e-12)
+        lloyd.fit(data)
+        for algorithm in ["elkan", "hamerly"]:
+            for split in [None, 0]:
+                kmeans = ht.cluster.KMeans(n_clusters=6, init=init, tol=1e-12, algorithm=algorithm)
+                kmeans.fit(data.resplit(split))
+                self.assertEqual(kmeans.get_params()["algorithm"], algorithm)
+                self.assertEqual(kmeans.n_iter_, lloyd.n_iter_)
+                self.assertTrue(
+                    ht.allclose(kmeans.cluster_centers_, lloyd.cluster_centers_, atol=1e-10)
+                )
+                self.assertEqual(kmeans.labels_.shape, lloyd.labels_.shape)
+                self.assertTrue(ht.equal(kmeans.labels_.resplit(None), lloyd.labels_.resplit(None)))
+
+        # single cluster and integer data
+        data = ht.random.randint(0, 100, (10 * ht.MPI_WORLD.size, 2), split=0)
+        for algorithm in ["elkan", "hamerly"]:
+            kmeans = ht.cluster.KMeans(n_clusters=1, algorithm=algorithm, random_state=seed)
+            kmeans.fit(data)
+            self.assertTrue(
+                ht.allclose(
+                    kmeans.cluster_centers_, data.astype(ht.float32).mean(axis=0), atol=1e-4
+                )
+            )
+
+    def test_kmeans_parallel_init(self):
+        n = 50 * ht.MPI_WORLD.size
+        data = create_spherical_dataset(
+            num_samples_cluster=n, radius=1.0, offset=4.0, dtype=ht.float32, random_state=1
+        )
+        expected = ht.array([[4.0] * 3, [-4.0] * 3, [8.0] * 3, [-8.0] * 3])
+        for split in [None, 0]:
+            kmeans = ht.cluster.KMeans(n_clusters=4, init="kmeans++", random_state=3)
+            kmeans._initialize_cluster_centers(data.resplit(split))
+            centers = kmeans.cluster_centers_
+            self.assertEqual(centers.shape, (4, 3))
+            self.assertIsNone(centers.split)
+            # every sphere gets a centroid
+            distances = ht.spatial.cdist(expected, centers)
+            self.assertTrue((distances.min(axis=1) < 2.0).all())
+            # the centroids are data points
+            for i in range(4):
+                self.assertTrue(ht.any(ht.sum(ht.abs(centers[i] - data), axis=1) == 0))
+
+        # less distinct points than clusters
+        data = ht.ones((4 * ht.MPI_WORLD.size, 2), split=0)
+        kmeans = ht.cluster.KMeans(n_clusters=3, init="kmeans++", random_state=3)
+        kmeans._initialize_cluster_centers(data)
+        self.assertTrue(ht.equal(kmeans.cluster_centers_, ht.ones((3, 2))))
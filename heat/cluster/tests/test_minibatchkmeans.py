@@ -0,0 +1,68 @@
+import heat as ht
+
+from heat.utils.data.spherical import create_spherical_dataset
+
+from ...core.tests.test_suites.basic_test import TestCase
+
+
+class TestMiniBatchKMeans(TestCase):
+    def test_clusterer(self):
+        kmeans = ht.cluster.MiniBatchKMeans()
+        self.assertTrue(ht.is_estimator(kmeans))
+        self.assertTrue(ht.is_clusterer(kmeans))
+
+    def test_get_and_set_params(self):
+        kmeans = ht.cluster.MiniBatchKMeans()
+        params = kmeans.get_params()
+
+        self.assertEqual(
+            params,
+            {
+                "n_clusters": 8,
+                "init": "random",
+                "max_iter": 100,
+                "batch_size": 1024,
+                "tol": 0.0,
+                "random_state": None,
+            },
+        )
+
+        params["batch_size"] = 10
+        kmeans.set_params(**params)
+        self.assertEqual(10, kmeans.batch_size)
+
+    def test_spherical_clusters(self):
+        seed = 1
+        n = 50 * ht.MPI_WORLD.size
+        data = create_spherical_dataset(
+            num_samples_cluster=n, radius=1.0, offset=4.0, dtype=ht.float32, random_state=seed
+        )
+        init = ht.array([[5.0, 4.0, 4.0], [-4.0, -5.0, -4.0], [8.0, 8.0, 9.0], [-7.0, -8.0, -8.0]])
+        for split in [None, 0]:
+            kmeans = ht.cluster.MiniBatchKMeans(
+                n_clusters=4, init=init, batch_size=64, max_iter=50, random_state=seed
+            )
+            kmeans.fit(data.resplit(split))
+            self.assertIsInstance(kmeans.cluster_centers_, ht.DNDarray)
+            self.assertEqual(kmeans.cluster_centers_.shape, (4, 3))
+            self.assertEqual(kmeans.n_iter_, 50)
+            self.assertEqual(kmeans.labels_.shape, (data.shape[0], 1))
+            # the four spheres are found
+            expected = ht.array([[4.0] * 3, [-4.0] * 3, [8.0] * 3, [-8.0] * 3])
+            self.assertTrue(ht.allclose(kmeans.cluster_centers_, expected, atol=0.5))
+
+        # convergence check
+        kmeans = ht.cluster.MiniBatchKMeans(n_clusters=4, tol=1e3, random_state=seed)
+        kmeans.fit(data)
+        self.assertEqual(kmeans.n_iter_, 1)
+
+    def test_exceptions(self):
+        iris_split = ht.load("heat/datasets/iris.csv", sep=";", split=1)
+        kmeans = ht.cluster.MiniBatchKMeans(n_clusters=3)
+        with self.assertRaises(NotImplementedError):
+            kmeans.fit(iris_split)
+        with self.assertRaises(ValueError):
+            kmeans.fit(iris_split.larray)
+        with self.assertRaises(ValueError):
+            kmeans = ht.cluster.MiniBatchKMeans(n_clusters=3, batch_size=0)
+            kmeans.fit(iris_split.resplit(0))
@@ -282,7 +282,7 @@ class MPICommunication(Communication):
         if is_contiguous:
             if counts is None:
                 return mpi_type, elements
-            factor = np.prod(obj.shape[1:])
+            factor = int(np.prod(obj.shape[1:]))
             return (
                 mpi_type,
                 (
@@ -1,6 +1,7 @@
 """Provides HeAT's core data structure, the DNDarray, a distributed n-dimensional array"""
 from __future__ import annotations
 
+import bisect
 import math
 import numpy as np
 import torch
@@ -530,9 +531,17 @@ class DNDarray:
         [1/2] (7, 2) (2, 2)
         [2/2] (7, 2) (2, 2)
         """
-        if self.is_balanced(force_check=True):
+        if not self.is_distributed():
+            return
+        lshape_map = self.create_lshape_map(force_check=True)
+        target_counts = [
+            self.comm.chunk(self.gshape, self.split, rank=pr)[1][self.split]
+            for pr in range(self.comm.size)
+        ]
+        if lshape_map[:, self.split].tolist() == target_counts:
+            self.__balanced = True
             return
-        self.redistribute_()
+        self.redistribute_(lshape_map=lshape_map)
 
     def __bool__(self) -> bool:
         """
@@ -781,6 +790,9 @@ class DNDarray:
         given. This does *NOT* redistribute or rebalance the resulting tensor. If the selection of values is
         unbalanced then the resultant tensor is also unbalanced!
         To redistributed the ``DNDarray`` use :func:`balance()` (issue #187)
+        Boolean masks and integer index arrays which are split along the split axis of the ``DNDarray`` are applied
+        without gathering the key on every process: masks are applied locally, the requested rows of index arrays are
+        fetched from their owning processes. The result of an index array is distributed like the index array.
 
         Parameters
         ----------
@@ -805,8 +817,27 @@ class DNDarray:
         (2/2) >>> tensor([0., 0.])
         """
         key = getattr(key, "copy()", key)
+        if self.is_distributed() and (
+            type(key) is int
+            or isinstance(key, tuple)
+            and len(key) == self.ndim
+            and all(type(k) is int for k in key)
+        ):
+            return self.__getitem_scalar(key if isinstance(key, tuple) else (key,))
+
         l_dtype = self.dtype.torch_type()
         advanced_ind = False
+        if isinstance(key, DNDarray) and self.is_distributed() and key.is_distributed():
+            # keys distributed along the split axis are applied without gathering them on every process
+            if self.split == 0 and key.split == 0:
+                if key.larray.dtype in [torch.bool, torch.uint8]:
+                    if key.gshape == self.gshape[: key.ndim]:
+                        return self.__getitem_mask(key)
+                elif key.ndim == 1 and not (
+                    key.larray.is_floating_point() or key.larray.is_complex()
+                ):
+                    return self.__getitem_routed(key)
+
         if isinstance(key, DNDarray) and key.ndim == self.ndim:
             """if the key is a DNDarray and it has as many dimensions as self, then each of the
             entries in the 0th dim refer to a single element. To handle this, the key is split
@@ -1007,18 +1038,14 @@ class DNDarray:
                 key[self.split] += self.gshape[self.split]
 
             active_rank = torch.where(key[self.split] >= chunk_starts)[0][-1].item()
-            # slice `self` on `active_rank`, allocate `arr` on all other ranks in preparation for Bcast
+            # slice `self` on `active_rank`, allocate `arr` on all other ranks in preparation for Bcast. The shape of
+            # the result is known globally, hence the data can be broadcast into the preallocated buffer directly.
             if rank == active_rank:
                 key[self.split] -= chunk_start.item()
-                arr = self.__array[tuple(key)].reshape(tuple(lout))
+                arr = self.__array[tuple(key)].reshape(tuple(lout)).contiguous()
             else:
                 arr = torch.empty(tuple(lout), dtype=self.larray.dtype, device=self.larray.device)
-            # broadcast result
-            # TODO: Replace with `self.comm.Bcast(arr, root=active_rank)` after fixing #784
-            arr = self.comm.bcast(arr, root=active_rank)
-            if arr.device != self.larray.device:
-                # todo: remove when unnecessary (also after #784)
-                arr = arr.to(device=self.larray.device)
+            self.comm.Bcast(arr, root=active_rank)
 
         return DNDarray(
             arr.type(l_dtype),
@@ -1030,6 +1057,116 @@ class DNDarray:
             balanced=True if new_split is None else None,
         )
 
+    def __getitem_scalar(self, key: Tuple[int, ...]) -> DNDarray:
+        # integer keys: reads along the split axis are answered by the owning process with a buffer-based broadcast
+        # into a preallocated tensor, the shape of the result is known on all processes
+        key = list(key)
+        for axis, k in enumerate(key):
+            if not -self.gshape[axis] <= k < self.gshape[axis]:
+                raise IndexError(
+                    f"index {k} is out of bounds for axis {axis} with size {self.gshape[axis]}"
+                )
+            key[axis] = k % self.gshape[axis]
+
+        gshape = self.gshape[len(key) :]
+        new_split = self.split - len(key) if self.split >= len(key) else None
+        if new_split is not None:
+            # the key does not select along the split axis, every process holds its part
+            arr = self.__array[tuple(key)]
+            return DNDarray(
+                arr, gshape, self.dtype, new_split, self.device, self.comm, balanced=self.balanced
+            )
+
+        _, displs = self.counts_displs()
+        owner = bisect.bisect_right(displs, key[self.split]) - 1
+        if self.comm.rank == owner:
+            key[self.split] -= displs[owner]
+            arr = self.__array[tuple(key)].contiguous()
+        else:
+            arr = torch.empty(gshape, dtype=self.__array.dtype, device=self.__array.device)
+        self.comm.Bcast(arr, root=owner)
+
+        return DNDarray(arr, gshape, self.dtype, None, self.device, self.comm, balanced=True)
+
+    def __getitem_mask(self, key: DNDarray) -> DNDarray:
+        # boolean mask along the split axis: the mask is aligned with the distribution of `self` and applied
+        # locally. The result is split along the first axis and not rebalanced.
+        if key.counts_displs() != self.counts_displs():
+            target_map = key.lshape_map
+            target_map[:, 0] = self.lshape_map[:, 0]
+            key = key.copy()
+            key.redistribute_(lshape_map=key.lshape_map, target_map=target_map)
+
+        arr = self.__array[key.larray.bool()]
+        gshape = (self.comm.allreduce(arr.shape[0], MPI.SUM),) + tuple(arr.shape[1:])
+
+        return DNDarray(arr, gshape, self.dtype, 0, self.device, self.comm, balanced=None)
+
+    def __getitem_routed(self, key: DNDarray) -> DNDarray:
+        # integer indices along the split axis: every index is sent to the process owning the requested row, which
+        # answers with the row. Both exchanges are single Alltoallv calls, the result is distributed like `key`.
+        _, displs = self.counts_displs()
+        device = self.__array.device
+        requests, order, send_counts, send_displs, recv_counts, recv_displs = self.__route(
+            key.larray
+        )
+
+        # requests
+        received = torch.empty(sum(recv_counts), dtype=torch.int64, device=device)
+        self.comm.Alltoallv(
+            (requests, send_counts, send_displs), (received, recv_counts, recv_displs)
+        )
+
+        # responses
+        rows = self.__array[received - displs[self.comm.rank]]
+        answers = torch.empty(
+            (requests.shape[0],) + rows.shape[1:], dtype=rows.dtype, device=device
+        )
+        self.comm.Alltoallv((rows, recv_counts, recv_displs), (answers, send_counts, send_displs))
+
+        arr = torch.empty_like(answers)
+        arr[order] = answers
+
+        return DNDarray(
+            arr,
+            key.gshape + self.gshape[1:],
+            self.dtype,
+            0,
+            self.device,
+            self.comm,
+            balanced=key.balanced,
+        )
+
+    def __route(
+        self, inds: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor, List[int], List[int], List[int], List[int]]:
+        # plans the exchange of global indices along the split axis 0 with the processes owning them. Returns the
+        # normalized indices ordered by owner, the order itself, and the send and receive counts and displacements.
+        size = self.comm.size
+        _, displs = self.counts_displs()
+        device = self.__array.device
+
+        inds = inds.to(dtype=torch.int64, device=device)
+        inds = torch.where(inds < 0, inds + self.gshape[0], inds)
+        owners = torch.bucketize(inds, torch.tensor(displs[1:], device=device), right=True)
+        order = torch.argsort(owners)
+
+        # exchange the number of indices together with a flag for out-of-bounds indices
+        send_meta = torch.empty((size, 2), dtype=torch.int64)
+        send_meta[:, 0] = torch.bincount(owners, minlength=size).cpu()
+        send_meta[:, 1] = int(((inds < 0) | (inds >= self.gshape[0])).any())
+        recv_meta = torch.empty_like(send_meta)
+        self.comm.Alltoall(send_meta, recv_meta)
+        if recv_meta[:, 1].any():
+            raise IndexError(f"index is out of bounds for axis 0 with size {self.gshape[0]}")
+
+        send_counts = send_meta[:, 0].tolist()
+        recv_counts = recv_meta[:, 0].tolist()
+        send_displs = [0] + send_meta[:-1, 0].cumsum(0).tolist()
+        recv_displs = [0] + recv_meta[:-1, 0].cumsum(0).tolist()
+
+        return inds[order], order, send_counts, send_displs, recv_counts, recv_displs
+
     if torch.cuda.device_count() > 0:
 
         def gpu(self) -> DNDarray:
@@ -1048,6 +1185,88 @@ class DNDarray:
         """
         return self.__cast(int)
 
+    def index_put_(
+        self,
+        key: Union[DNDarray, torch.Tensor, List[int]],
+        value: Union[float, DNDarray, torch.Tensor],
+        mode: str = "assign",
+    ) -> DNDarray:
+        """
+        In-place update of the elements selected by an integer index array or a boolean mask with ``value``. Duplicate
+        indices are combined according to ``mode``, which allows e.g. histogram-style accumulation into a distributed
+        ``DNDarray``. If ``self`` is split along axis 0, every (index, value) pair is sent directly to the process
+        owning the target row with one ``Alltoallv`` for the indices and one for the values; the key is not gathered.
+
+        Parameters
+        ----------
+        key : DNDarray or torch.Tensor or List[int]
+            Either a 1-D integer array of indices along axis 0, or a boolean mask with the shape of the leading
+            dimensions of ``self``.
+        value : float or DNDarray or torch.Tensor
+            The values, broadcastable to the shape of the selection, i.e. ``(len(key),) + self.shape[1:]`` for an
+            index array. The value rows are matched with the key elements in global order.
+        mode : str, optional
+            How the values are combined with the selected elements:
+
+            - ``'assign'``: overwrite, for duplicate indices an arbitrary one of the values is kept.
+            - ``'add'``: add the values, duplicate indices accumulate.
+            - ``'max'``: keep the element-wise maximum.
+
+        Raises
+        ------
+        ValueError
+            If ``mode`` is unknown, or ``key`` or ``value`` do not match the shape of ``self``
+        IndexError
+            If an index is out of bounds
+        NotImplementedError
+            If ``self`` is split along an axis other than 0
+
+        Examples
+        --------
+        >>> x = ht.zeros(4, split=0)
+        >>> x.index_put_(ht.array([0, 3, 3, 1], split=0), 1.0, mode="add")
+        DNDarray([1., 1., 0., 2.], dtype=ht.float32, device=cpu:0, split=0)
+        """
+        if mode not in ["assign", "add", "max"]:
+            raise ValueError(f"mode must be one of 'assign', 'add' or 'max', but was {mode}")
+        if not isinstance(key, DNDarray):
+            key = factories.array(key, device=self.device, comm=self.comm)
+        mask = key.larray.dtype in [torch.bool, torch.uint8]
+        if mask and key.gshape != self.gshape[: key.ndim]:
+            raise ValueError(
+                f"mask of shape {key.gshape} does not match the leading dimensions of {self.gshape}"
+            )
+        if not mask and (
+            key.ndim != 1 or key.larray.is_floating_point() or key.larray.is_complex()
+        ):
+            raise ValueError(f"key must be a 1-D integer array or a boolean mask, but was {key}")
+        if self.split is not None and self.split != 0:
+            raise NotImplementedError(
+                f"index_put_ is only implemented for arrays with split 0 or None, but split was {self.split}"
+            )
+
+        if not self.is_distributed():
+            key = manipulations.resplit(key).larray
+            if mask:
+                key = key.bool()
+                n = int(key.sum())
+            else:
+                key = key.to(torch.int64)
+                n = key.shape[0]
+                if ((key < -self.gshape[0]) | (key >= self.gshape[0])).any():
+                    raise IndexError(
+                        f"index is out of bounds for axis 0 with size {self.gshape[0]}"
+                    )
+                key = torch.where(key < 0, key + self.gshape[0], key)
+            values = self.__scatter_values(value, n, 0, n, self.gshape[key.ndim :])
+            self.__scatter_local(key, values, mode, unique=mask)
+        elif mask:
+            self.__setitem_mask(key, value, mode)
+        else:
+            self.__setitem_routed(key, value, mode)
+
+        return self
+
     def is_balanced(self, force_check: bool = False) -> bool:
         """
         Determine if ``self`` is balanced evenly (or as evenly as possible) across all nodes
@@ -1105,9 +1324,10 @@ class DNDarray:
         """
         if self.size > 1:
             raise ValueError("only one-element DNDarrays can be converted to Python scalars")
-        # make sure the element is on every process
-        self.resplit_(None)
-        return self.__array.item()
+        if not self.is_distributed():
+            return self.__array.item()
+        # broadcast the element from the process holding it
+        return self.__getitem_scalar((0,) * self.ndim).larray.item()
 
     def __len__(self) -> int:
         """
@@ -1166,7 +1386,7 @@ class DNDarray:
         ----------
         lshape_map : torch.Tensor, optional
             The current lshape of processes.
-            Units are ``[rank, lshape]``.
+            Units are ``[rank, lshape]``. It is updated in-place to the new distribution.
         target_map : torch.Tensor, optional
             The desired distribution across the processes.
             Units are ``[rank, target lshape]``.
@@ -1233,125 +1453,77 @@ class DNDarray:
                 )
             # no info on balanced status
             self.__balanced = False
-        lshape_cumsum = torch.cumsum(lshape_map[..., self.split], dim=0)
-        chunk_cumsum = torch.cat(
-            (
-                torch.tensor([0], device=self.device.torch_device),
-                torch.cumsum(target_map[..., self.split], dim=0),
-            ),
-            dim=0,
+        self.__array = self.__redistribute_shuffle(
+            lshape_map[..., self.split].tolist(), target_map[..., self.split].tolist()
         )
-        # need the data start as well for process 0
-        for rcv_pr in range(self.comm.size - 1):
-            st = chunk_cumsum[rcv_pr].item()
-            sp = chunk_cumsum[rcv_pr + 1].item()
-            # start pr should be the next process with data
-            if lshape_map[rcv_pr, self.split] >= target_map[rcv_pr, self.split]:
-                # if there is more data on the process than the start process than start == stop
-                st_pr = rcv_pr
-                sp_pr = rcv_pr
-            else:
-                # if there is less data on the process than need to get the data from the next data
-                # with data
-                # need processes > rcv_pr with lshape > 0
-                st_pr = (
-                    torch.nonzero(input=lshape_map[rcv_pr:, self.split] > 0, as_tuple=False)[
-                        0
-                    ].item()
-                    + rcv_pr
-                )
-                hld = (
-                    torch.nonzero(input=sp <= lshape_cumsum[rcv_pr:], as_tuple=False).flatten()
-                    + rcv_pr
-                )
-                sp_pr = hld[0].item() if hld.numel() > 0 else self.comm.size
-
-            # st_pr and sp_pr are the processes on which the data sits at the beginning
-            # need to loop from st_pr to sp_pr + 1 and send the pr
-            for snd_pr in range(st_pr, sp_pr + 1):
-                if snd_pr == self.comm.size:
-                    break
-                data_required = abs(sp - st - lshape_map[rcv_pr, self.split].item())
-                send_amt = (
-                    data_required
-                    if data_required <= lshape_map[snd_pr, self.split]
-                    else lshape_map[snd_pr, self.split]
-                )
-                if (sp - st) <= lshape_map[rcv_pr, self.split].item() or snd_pr == rcv_pr:
-                    send_amt = 0
-                # send amount is the data still needed by recv if that is available on the snd
-                if send_amt != 0:
-                    self.__redistribute_shuffle(
-                        snd_pr=snd_pr, send_amt=send_amt, rcv_pr=rcv_pr, snd_dtype=snd_dtype
-                    )
-                lshape_cumsum[snd_pr] -= send_amt
-                lshape_cumsum[rcv_pr] += send_amt
-                lshape_map[rcv_pr, self.split] += send_amt
-                lshape_map[snd_pr, self.split] -= send_amt
-            if lshape_map[rcv_pr, self.split] > target_map[rcv_pr, self.split]:
-                # if there is any data left on the process then send it to the next one
-                send_amt = lshape_map[rcv_pr, self.split] - target_map[rcv_pr, self.split]
-                self.__redistribute_shuffle(
-                    snd_pr=rcv_pr, send_amt=send_amt.item(), rcv_pr=rcv_pr + 1, snd_dtype=snd_dtype
-                )
-                lshape_cumsum[rcv_pr] -= send_amt
-                lshape_cumsum[rcv_pr + 1] += send_amt
-                lshape_map[rcv_pr, self.split] -= send_amt
-                lshape_map[rcv_pr + 1, self.split] += send_amt
-
-        if any(lshape_map[..., self.split] != target_map[..., self.split]):
-            # sometimes need to call the redistribute once more,
-            # (in the case that the second to last processes needs to get data from +1 and -1)
-            self.redistribute_(lshape_map=lshape_map, target_map=target_map)
-
+        lshape_map[..., self.split] = target_map[..., self.split]
         self.__lshape_map = target_map
 
-    def __redistribute_shuffle(
-        self,
-        snd_pr: Union[int, torch.Tensor],
-        send_amt: Union[int, torch.Tensor],
-        rcv_pr: Union[int, torch.Tensor],
-        snd_dtype: torch.dtype,
-    ):
+    def __redistribute_shuffle(self, counts: List[int], target_counts: List[int]) -> torch.Tensor:
         """
-        Function to abstract the function used during redistribute for shuffling data between
-        processes along the split axis
+        Function to abstract the data movement during redistribute. Every process exchanges the overlap of its current
+        and its target range along the split axis with exactly the processes whose ranges intersect it. All transfers
+        are posted concurrently as non-blocking point-to-point messages straight into the preallocated result.
 
         Parameters
         ----------
-        snd_pr : int or torch.Tensor
-            Sending process
-        send_amt : int or torch.Tensor
-            Amount of data to be sent by the sending process
-        rcv_pr : int or torch.Tensor
-            Receiving process
-        snd_dtype : torch.dtype
-            Torch type of the data in question
-        """
-        rank = self.comm.rank
-        send_slice = [slice(None)] * self.ndim
-        keep_slice = [slice(None)] * self.ndim
-        if rank == snd_pr:
-            if snd_pr < rcv_pr:  # data passed to a higher rank (off the bottom)
-                send_slice[self.split] = slice(
-                    self.lshape[self.split] - send_amt, self.lshape[self.split]
-                )
-                keep_slice[self.split] = slice(0, self.lshape[self.split] - send_amt)
-            if snd_pr > rcv_pr:  # data passed to a lower rank (off the top)
-                send_slice[self.split] = slice(0, send_amt)
-                keep_slice[self.split] = slice(send_amt, self.lshape[self.split])
-            data = self.__array[send_slice].clone()
-            self.comm.Send(data, dest=rcv_pr, tag=685)
-            self.__array = self.__array[keep_slice]
-        if rank == rcv_pr:
-            shp = list(self.gshape)
-            shp[self.split] = send_amt
-            data = torch.zeros(shp, dtype=snd_dtype, device=self.device.torch_device)
-            self.comm.Recv(data, source=snd_pr, tag=685)
-            if snd_pr < rcv_pr:  # data passed from a lower rank (append to top)
-                self.__array = torch.cat((data, self.__array), dim=self.split)
-            if snd_pr > rcv_pr:  # data passed from a higher rank (append to bottom)
-                self.__array = torch.cat((self.__array, data), dim=self.split)
+        counts : List[int]
+            Current number of elements along the split axis per process
+        target_counts : List[int]
+            Target number of elements along the split axis per process
+        """
+        rank, size = self.comm.rank, self.comm.size
+        offsets = [0] + np.cumsum(counts).tolist()
+        target_offsets = [0] + np.cumsum(target_counts).tolist()
+
+        # the ranges along the split axis are ordered, so every process exchanges data only with
+        # the contiguous group of processes whose ranges intersect its own
+        def overlaps(own: int, bounds: List[int], other_bounds: List[int]):
+            first = max(bisect.bisect_right(other_bounds, bounds[own]) - 1, 0)
+            for other in range(first, size):
+                if other_bounds[other] >= bounds[own + 1]:
+                    break
+                start = max(bounds[own], other_bounds[other])
+                stop = min(bounds[own + 1], other_bounds[other + 1])
+                if stop > start and other != rank:
+                    yield other, start, stop
+
+        receives = list(overlaps(rank, target_offsets, offsets))
+        sends = list(overlaps(rank, offsets, target_offsets))
+        own_start = max(offsets[rank], target_offsets[rank])
+        own_stop = max(min(offsets[rank + 1], target_offsets[rank + 1]), own_start)
+
+        # move the split axis to the front, so that every transfer is a contiguous block of rows
+        local = self.__array
+        if self.split != 0:
+            local = local.transpose(0, self.split)
+        requests = []
+        for dest, start, stop in sends:
+            data = local[start - offsets[rank] : stop - offsets[rank]].contiguous()
+            requests.append(self.comm.Isend(data, dest=dest, tag=685))
+
+        if not receives:
+            # the new local data is a part of the current one, keep it as a view
+            for request in requests:
+                request.Wait()
+            start = own_start - offsets[rank] if own_stop > own_start else 0
+            return self.__array.narrow(self.split, start, own_stop - own_start)
+
+        result = torch.empty(
+            (target_counts[rank],) + tuple(local.shape[1:]), dtype=local.dtype, device=local.device
+        )
+        for source, start, stop in receives:
+            window = result[start - target_offsets[rank] : stop - target_offsets[rank]]
+            requests.append(self.comm.Irecv(window, source=source, tag=685))
+        result[own_start - target_offsets[rank] : own_stop - target_offsets[rank]] = local[
+            own_start - offsets[rank] : own_stop - offsets[rank]
+        ]
+        for request in requests:
+            request.Wait()
+
+        if self.split != 0:
+            result = result.transpose(0, self.split).contiguous()
+        return result
 
     def resplit_(self, axis: int = None):
         """
@@ -1519,6 +1691,17 @@ class DNDarray:
                           [0., 1., 0., 0., 0.]])
         """
         key = getattr(key, "copy()", key)
+        if isinstance(key, DNDarray) and self.is_distributed() and key.is_distributed():
+            # keys distributed along the split axis are scattered to the owning processes
+            if self.split == 0 and key.split == 0:
+                if key.larray.dtype in [torch.bool, torch.uint8]:
+                    if key.gshape == self.gshape[: key.ndim]:
+                        return self.__setitem_mask(key, value, "assign")
+                elif key.ndim == 1 and not (
+                    key.larray.is_floating_point() or key.larray.is_complex()
+                ):
+                    return self.__setitem_routed(key, value, "assign")
+
         try:
             if value.split != self.split:
                 val_split = int(value.split)
@@ -1773,6 +1956,135 @@ class DNDarray:
                 key[self.split] = key[self.split] + self.shape[self.split] - chunk_start
                 self.__setter(tuple(key), value)
 
+    def __setitem_mask(self, key: DNDarray, value: Union[float, DNDarray, torch.Tensor], mode: str):
+        # boolean mask along the split axis 0: the mask is aligned with the distribution of `self` and applied
+        # locally. Only value arrays with one row per selected element require communication.
+        counts, displs = self.counts_displs()
+        rank = self.comm.rank
+        if not key.is_distributed():
+            local_mask = key.larray[displs[rank] : displs[rank] + counts[rank]]
+        else:
+            if key.counts_displs() != (counts, displs):
+                target_map = key.lshape_map
+                target_map[:, 0] = self.lshape_map[:, 0]
+                key = key.copy()
+                key.redistribute_(lshape_map=key.lshape_map, target_map=target_map)
+            local_mask = key.larray
+        local_mask = local_mask.bool()
+
+        count = int(local_mask.sum())
+        nonzeros = self.comm.allgather(count)
+        values = self.__scatter_values(
+            value, sum(nonzeros), sum(nonzeros[:rank]), count, self.gshape[key.ndim :]
+        )
+        self.__scatter_local(local_mask, values, mode, unique=True)
+
+    def __setitem_routed(
+        self, key: DNDarray, value: Union[float, DNDarray, torch.Tensor], mode: str
+    ):
+        # integer indices along the split axis 0: every (index, value) pair is sent to the process owning the row
+        rank = self.comm.rank
+        if key.is_distributed():
+            inds = key.larray
+            offset = key.counts_displs()[1][rank]
+        else:
+            # replicated keys are shared out, every process routes one chunk of it
+            offset, _, slices = self.comm.chunk(key.gshape, 0)
+            inds = key.larray[slices]
+        values = self.__scatter_values(value, key.gshape[0], offset, inds.shape[0], self.gshape[1:])
+
+        inds, order, send_counts, send_displs, recv_counts, recv_displs = self.__route(inds)
+        values = values[order]
+        received_inds = torch.empty(sum(recv_counts), dtype=torch.int64, device=inds.device)
+        received_values = torch.empty(
+            (received_inds.shape[0],) + values.shape[1:], dtype=values.dtype, device=values.device
+        )
+        self.comm.Alltoallv(
+            (inds, send_counts, send_displs), (received_inds, recv_counts, recv_displs)
+        )
+        self.comm.Alltoallv(
+            (values, send_counts, send_displs), (received_values, recv_counts, recv_displs)
+        )
+
+        _, displs = self.counts_displs()
+        self.__scatter_local(received_inds - displs[rank], received_values, mode, unique=False)
+
+    def __scatter_local(
+        self, key: torch.Tensor, values: torch.Tensor, mode: str, unique: bool = False
+    ):
+        # updates the local elements selected by a mask or a 1-D index tensor according to `mode`
+        if mode == "assign":
+            self.__array[key] = values
+        elif mode == "add":
+            if unique:
+                self.__array[key] += values
+            else:
+                self.__array.index_put_((key,), values, accumulate=True)
+        elif unique:
+            self.__array[key] = torch.maximum(self.__array[key], values)
+        elif key.numel() > 0:
+            # the maximum is applied in rounds, each round contains every duplicate index at most once
+            sorted_key, perm = key.sort()
+            _, repeats = torch.unique_consecutive(sorted_key, return_counts=True)
+            starts = repeats.cumsum(0) - repeats
+            occurrence = torch.arange(key.shape[0], device=key.device) - torch.repeat_interleave(
+                starts, repeats
+            )
+            for i in range(int(repeats.max())):
+                selection = perm[occurrence == i]
+                rows = key[selection]
+                self.__array[rows] = torch.maximum(self.__array[rows], values[selection])
+
+    def __scatter_values(
+        self,
+        value: Union[float, DNDarray, torch.Tensor],
+        n: int,
+        offset: int,
+        count: int,
+        row_shape: Tuple[int, ...],
+    ) -> torch.Tensor:
+        # returns the `count` value rows belonging to the elements `offset` to `offset + count` of a selection of
+        # `n` elements, broadcast to `(count,) + row_shape`
+        shape = (n,) + tuple(row_shape)
+        if isinstance(value, DNDarray):
+            value_shape = value.gshape
+        elif isinstance(value, torch.Tensor):
+            value_shape = tuple(value.shape)
+        else:
+            value = torch.as_tensor(value, device=self.device.torch_device)
+            value_shape = tuple(value.shape)
+        try:
+            if torch.broadcast_shapes(value_shape, shape) != shape:
+                raise RuntimeError
+        except RuntimeError:
+            raise ValueError(f"value of shape {value_shape} cannot be broadcast to {shape}")
+
+        rows = len(value_shape) == len(shape) and value_shape[0] == n
+        if isinstance(value, DNDarray):
+            if rows and value.is_distributed() and value.split == 0:
+                # fetch the matching rows from their owners
+                fetch = torch.arange(offset, offset + count, device=self.device.torch_device)
+                fetch = DNDarray(
+                    fetch,
+                    (n,),
+                    canonical_heat_type(torch.int64),
+                    0,
+                    self.device,
+                    self.comm,
+                    balanced=None,
+                )
+                value = value.__getitem_routed(fetch).larray
+                rows = False
+            else:
+                value = manipulations.resplit(value).larray
+        if rows:
+            value = value[offset : offset + count]
+
+        return torch.broadcast_to(
+            value.to(dtype=self.__array.dtype, device=self.__array.device),
+            (count,) + tuple(row_shape),
+        )
+
     def __setter(
         self,
         key: Union[int, Tuple[int, ...], List[int, ...]],
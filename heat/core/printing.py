@@ -205,9 +205,11 @@ def __str__(dndarray) -> str:
     )
 
 
-def _torch_data(dndarray, summarize) -> DNDarray:
+def _torch_data(dndarray, summarize) -> torch.Tensor:
     """
-    Extracts the data to be printed from the DNDarray in form of a torch tensor and returns it.
+    Extracts the data to be printed from the DNDarray in form of a torch tensor and returns it. The data is collected
+    on process 0 only, where it is returned. Unbalanced arrays are not rebalanced, the global offsets of the local data
+    are taken from the lshape map. If summarized, only the edge items are collected.
 
     Parameters
     ----------
@@ -216,67 +218,48 @@ def _torch_data(dndarray, summarize) -> DNDarray:
     summarize : bool
         Flag indicating whether to print the full data or summarized, i.e. ellipsed, version of the data.
     """
-    if not dndarray.is_balanced():
-        dndarray.balance_()
-    # data is not split, we can use it as is
-    if dndarray.split is None or dndarray.comm.size == 1:
-        data = dndarray.larray
-    # split, but no summary required, we collect it
-    elif not summarize:
-        data = dndarray.copy().resplit_(None).larray
-    # split, but summarized, collect the slices from all nodes and pass it on
-    else:
-        edgeitems = torch._tensor_str.PRINT_OPTS.edgeitems
-        double_items = 2 * edgeitems
-        ndims = dndarray.ndim
-        data = dndarray.larray
-
-        for i in range(ndims):
-            # skip over dimensions that are smaller than twice the number of edge items to display
-            if dndarray.gshape[i] <= double_items:
-                continue
-
-            # non-split dimension, can slice locally
-            if i != dndarray.split:
-                start_tensor = torch.index_select(
-                    data, i, torch.arange(edgeitems + 1, device=data.device)
-                )
-                end_tensor = torch.index_select(
-                    data,
-                    i,
-                    torch.arange(
-                        dndarray.lshape[i] - edgeitems, dndarray.lshape[i], device=data.device
-                    ),
-                )
-                data = torch.cat([start_tensor, end_tensor], dim=i)
-            # split-dimension , need to respect the global offset
-            elif i == dndarray.split and dndarray.gshape[i] > double_items:
-                offset, _, _ = dndarray.comm.chunk(dndarray.gshape, i)
-
-                if offset < edgeitems + 1:
-                    end = min(dndarray.lshape[i], edgeitems + 1 - offset)
-                    data = torch.index_select(data, i, torch.arange(end, device=data.device))
-                elif dndarray.gshape[i] - edgeitems < offset - dndarray.lshape[i]:
-                    global_start = dndarray.gshape[i] - edgeitems
-                    data = torch.index_select(
-                        data,
-                        i,
-                        torch.arange(
-                            max(0, global_start - offset),
-                            dndarray.lshape[i],
-                            device=data.device,
-                        ),
-                    )
-        # exchange data
-        received = dndarray.comm.gather(data)
-        if dndarray.comm.rank == 0:
-            # concatenate data along the split axis
-            # problem: CUDA-aware MPI `gather`s all `data` in a list of tensors on MPI-process no. 0, but not necessarily on the same cuda device.
-            # Indeed, `received` may be a list of tensors on cuda device 0, cuda device 1, ... therefore, we need to move all entries of the list to cuda device 0 before applying `cat`.
-            device0 = received[0].device
-            received = [tens.to(device0) for tens in received]
-            data = torch.cat(received, dim=dndarray.split)
-    return data
+    # data is not distributed, we can use it as is
+    if not dndarray.is_distributed():
+        return dndarray.larray
+
+    edgeitems = torch._tensor_str.PRINT_OPTS.edgeitems
+    split = dndarray.split
+    counts, displs = dndarray.counts_displs()
+    gather_counts = list(counts)
+    data = dndarray.larray
+
+    for i in range(dndarray.ndim):
+        # skip over dimensions that are printed completely
+        if not summarize or dndarray.gshape[i] <= 2 * edgeitems:
+            continue
+
+        # one more leading item than displayed, this makes torch insert the ellipsis
+        items = torch.cat(
+            [
+                torch.arange(edgeitems + 1, device=data.device),
+                torch.arange(
+                    dndarray.gshape[i] - edgeitems, dndarray.gshape[i], device=data.device
+                ),
+            ]
+        )
+        # split dimension, respect the global offsets
+        if i == split:
+            gather_counts = [
+                int(((items >= displ) & (items < displ + count)).sum())
+                for count, displ in zip(counts, displs)
+            ]
+            offset = displs[dndarray.comm.rank]
+            items = items[(items >= offset) & (items < offset + data.shape[i])] - offset
+        data = torch.index_select(data, i, items)
+
+    # collect the data on process 0, the split dimension is moved to the front for the exchange
+    data = data.transpose(0, split).contiguous()
+    shape = (sum(gather_counts) if dndarray.comm.rank == 0 else 0,) + data.shape[1:]
+    received = torch.empty(shape, dtype=data.dtype, device=data.device)
+    gather_displs = [sum(gather_counts[:r]) for r in range(len(gather_counts))]
+    dndarray.comm.Gatherv(data, (received, gather_counts, gather_displs), root=0)
+
+    return received.transpose(0, split)
 
 
 def _tensor_str(dndarray, indent: int) -> str:
@@ -298,6 +281,8 @@ def _tensor_str(dndarray, indent: int) -> str:
     # to do so, we slice up the torch data and forward it to torch internal printing mechanism
     summarize = elements > get_printoptions()["threshold"]
     torch_data = _torch_data(dndarray, summarize)
+    if dndarray.comm.rank != 0:
+        return ""
     formatter = torch._tensor_str._Formatter(torch_data)
 
     return torch._tensor_str._tensor_str_with_formatter(torch_data, indent, summarize, formatter)
@@ -1,6 +1,8 @@
 """Provides parallel random number generators (pRNG)"""
 from __future__ import annotations
 
+import math
+import numpy as np
 import time
 import torch
 
@@ -19,6 +21,7 @@ from .dndarray import DNDarray
 from .types import datatype
 
 __all__ = [
+    "Generator",
     "get_state",
     "normal",
     "permutation",
@@ -58,14 +61,16 @@ def __counter_sequence(
     split: Optional[int],
     device: Device,
     comm: Communication,
-) -> Tuple[torch.tensor, torch.tensor, Tuple[int, ...], slice]:
+    counter: int,
+) -> Tuple[torch.Tensor, torch.Tensor, Tuple[int, ...], slice, int]:
     """
     Generates a sequence of numbers to be used as the "clear text" for the threefry encryption, i.e. the pseudo random
     number generator. Due to the fact that threefry always requires pairs of inputs, the input sequence may not just be
     a simple range including the global offset, but rather needs to be to independent vectors, one containing the range
     and the other having the interleaved high-bits counter in it.
     Returns the high-bits and low-bits vectors for the threefry encryption (``torch.tensor``), the shape ``x_0`` and
-    ``x_1`` and the slice that needs to be applied to the resulting random number tensor.
+    ``x_1`` and the slice that needs to be applied to the resulting random number tensor as well as the advanced
+    counter. Only integer arithmetic is used, i.e. the sequence is exact for any number of elements.
 
     Parameters
     ----------
@@ -79,6 +84,8 @@ def __counter_sequence(
         Specifies the device the tensor shall be allocated on.
     comm: Communication
         Handle to the nodes holding distributed parts or copies of this tensor.
+    counter : int
+        The 128-bit counter state of the generator
 
     Returns
     -------
@@ -87,115 +94,50 @@ def __counter_sequence(
     x_1 : torch.Tensor
         The low-bits vector for the threefry encryption.
     lshape : tuple of ints
-        The shape x_0 and x_1 need to be reshaped to after encryption. May be slightly larger than the actual local
-        portion of the random number tensor due to sequence overlaps of the counter sequence.
+        The shape of the local portion of the random number tensor.
     slice : python slice
-        The slice that needs to be applied to the resulting random number tensor
+        The slice that needs to be applied to the flattened, interleaved result of the encryption. The sequence may be
+        slightly larger than the actual local portion of the random number tensor due to overlaps with the neighboring
+        processes.
+    counter : int
+        The counter state after drawing the random number tensor.
     """
-    # get the global random state into the function, might want to factor this out into a class later
-    global __counter
-
-    # Share this initial local state to update it correctly later
-    tmp_counter = __counter
-    rank = comm.Get_rank()
-    size = comm.Get_size()
-    max_count = 0xFFFFFFFF if dtype == torch.int32 else 0xFFFFFFFFFFFFFFFF
+    bits = 32 if dtype == torch.int32 else 64
+    max_count = (1 << bits) - 1
 
     # extract the counter state of the random number generator
-    if dtype is torch.int32:
-        c_0 = (__counter & (max_count << 32)) >> 32
-    else:  # torch.int64
-        c_0 = (__counter & (max_count << 64)) >> 64
-    c_1 = __counter & max_count
-    total_elements = torch.prod(torch.tensor(shape))
-    if total_elements.item() > 2 * max_count:
+    c_0 = (counter >> bits) & max_count
+    c_1 = counter & max_count
+    total_elements = math.prod(shape)
+    if total_elements > 2 * max_count:
         raise ValueError(f"Shape is to big with {total_elements} elements")
 
+    # position of the local elements in the global sequence
     if split is None:
-        values = total_elements.item() // 2 + total_elements.item() % 2
-        even_end = total_elements.item() % 2 == 0
-        lslice = slice(None) if even_end else slice(None, -1)
-        start = c_1
-        end = start + int(values)
-        lshape = shape
+        start, elements, lshape = 0, total_elements, tuple(shape)
     else:
-        offset, lshape, _ = comm.chunk(shape, split)
+        _, lshape, _ = comm.chunk(shape, split)
         counts, displs, _ = comm.counts_displs_shape(shape, split)
+        slab = math.prod(shape[:split] + shape[split + 1 :])
+        start = slab * displs[comm.rank]
+        elements = slab * counts[comm.rank]
+    first = start // 2
+    pairs = (start + elements + 1) // 2 - first
+    lslice = slice(start % 2, start % 2 + elements)
+
+    # low bits, overflows are carried into the high bits
+    base = c_1 + first
+    x_1 = torch.arange(pairs, dtype=dtype, device=device.torch_device).add_(__wrap(base, bits))
+    x_0 = torch.full_like(x_1, __wrap(c_0, bits))
+    for carry in (1, 2):
+        overflow = (carry << bits) - base
+        if overflow < pairs:
+            x_0[max(overflow, 0) :] += 1
 
-        # Calculate number of local elements per process
-        local_elements = [total_elements.item() / shape[split] * counts[i] for i in range(size)]
-        cum_elements = torch.cumsum(torch.tensor(local_elements, device=device.torch_device), dim=0)
-
-        # Calculate the correct borders and slices
-        even_start = True if rank == 0 else cum_elements[rank - 1] % 2 == 0
-        start = c_1 if rank == 0 else int(cum_elements[rank - 1] / 2) + c_1
-        elements = local_elements[rank] / 2
-        lslice = slice(None)
-        if even_start:
-            # no overlap with previous processes
-            if elements == int(elements):
-                # even number of elements
-                end = int(elements)
-            else:
-                # odd number of elements
-                end = int(elements) + 1
-                lslice = slice(None, -1)
-        else:
-            # overlap with previous processes
-            if elements == int(elements):
-                # even number of elements
-                end = int(elements) + 1
-                lslice = slice(1, -1)
-            else:
-                # Odd number of elements
-                end = int(elements) + 1
-                lslice = slice(1, None)
-        start = int(start)
-        end += start
-
-    # check x_1 for overflow
-    lrange = [start, end]
-    signed_mask = 0x7FFFFFFF if dtype == torch.int32 else 0x7FFFFFFFFFFFFFFF
-    diff = 0 if lrange[1] <= signed_mask else lrange[1] - signed_mask
-    lrange[0], lrange[1] = lrange[0] - diff, lrange[1] - diff
-
-    # create x_1 counter sequence
-    x_1 = torch.arange(*lrange, dtype=dtype, device=device.torch_device)
-    while diff > signed_mask:
-        # signed_mask is maximum that can be added at a time because torch does not support unit64 or unit32
-        x_1 += signed_mask
-        diff -= signed_mask
-    x_1 += diff
-
-    # generate the x_0 counter sequence
-    x_0 = torch.empty_like(x_1)
-    diff = c_0 - signed_mask
-    if diff > 0:
-        # same problem as for x_1 with the overflow
-        x_0.fill_(signed_mask)
-        while diff > signed_mask:
-            x_0 += signed_mask
-            diff -= signed_mask
-        x_0 += diff
-    else:
-        x_0.fill_(c_0)
-
-    # detect if x_0 needs to be increased for current values
-    if end > max_count:
-        if start > max_count:
-            # x_0 changed in previous process, increase all values
-            x_0 += 1
-        else:
-            # x_0 changes after reaching the overflow in this process
-            x_0[-(end - max_count - 1) :] += 1
-
-    # correctly increase the counter variable
-    used_values = int(torch.ceil(total_elements / 2))
     # increase counter but not over 128 bit
-    tmp_counter += used_values
-    __counter = tmp_counter & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF  # 128-bit mask
+    counter = (counter + (total_elements + 1) // 2) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
 
-    return x_0.contiguous(), x_1.contiguous(), lshape, lslice
+    return x_0, x_1, lshape, lslice, counter
 
 
 def get_state() -> Tuple[str, int, int, int, float]:
@@ -224,9 +166,9 @@ def __int32_to_float32(values: torch.Tensor) -> torch.Tensor:
     Parameters
     ----------
     values : torch.Tensor (int32)
-        Values to be converted to floating points numbers in interval [0.0, 1.0).
+        Values to be converted to floating points numbers in interval [0.0, 1.0). Overwritten in the process.
     """
-    return (values & 0x7FFFFF).type(torch.float32) * __INT32_TO_FLOAT32
+    return values.bitwise_and_(0x7FFFFF).to(torch.float32).mul_(__INT32_TO_FLOAT32)
 
 
 def __int64_to_float64(values: torch.Tensor) -> torch.Tensor:
@@ -238,9 +180,9 @@ def __int64_to_float64(values: torch.Tensor) -> torch.Tensor:
     Parameters
     ----------
     values : torch.Tensor (int64)
-        Values to be converted to floating points numbers in interval [0.0, 1.0).
+        Values to be converted to floating points numbers in interval [0.0, 1.0). Overwritten in the process.
     """
-    return (values & 0x1FFFFFFFFFFFFF).type(torch.float64) * __INT64_TO_FLOAT64
+    return values.bitwise_and_(0x1FFFFFFFFFFFFF).to(torch.float64).mul_(__INT64_TO_FLOAT64)
 
 
 def __kundu_transform(values: torch.Tensor) -> torch.Tensor:
@@ -308,6 +250,50 @@ def normal(
     >>> ht.random.normal(ht.array([-1,2]), ht.array([0.5, 2]), (2,))
     DNDarray([-1.4669,  1.6596], dtype=ht.float64, device=cpu:0, split=None)
     """
+    global __counter
+    values, __counter = _normal(
+        mean, std, shape, dtype, split, device, comm, (__seed, __seed), __counter
+    )
+
+    return values
+
+
+def _normal(
+    mean: Union[float, DNDarray],
+    std: Union[float, DNDarray],
+    shape: Optional[Tuple[int, ...]],
+    dtype: Type[datatype],
+    split: Optional[int],
+    device: Optional[str],
+    comm: Optional[Communication],
+    key: Tuple[int, int],
+    counter: int,
+) -> Tuple[DNDarray, int]:
+    """
+    Implementation of :func:`normal` for an explicit generator state. Returns the random values and the advanced
+    counter.
+
+    Parameters
+    ----------
+    mean : float or DNDarray
+        The mean of the distribution.
+    std : float or DNDarray
+        The standard deviation of the distribution. Must be non-negative.
+    shape : tuple[int] or None
+        The shape of the returned array
+    dtype : Type[datatype]
+        The datatype of the returned values, :class:`~heat.core.types.float32` or :class:`~heat.core.types.float64`.
+    split : int or None
+        The axis along which the array is split and distributed
+    device : str or None
+        Specifies the :class:`~heat.core.devices.Device` the array shall be allocated on
+    comm : Communication or None
+        Handle to the nodes holding distributed parts or copies of this array.
+    key : Tuple[int, int]
+        The Threefry key, i.e. seed and stream
+    counter : int
+        The counter state of the generator
+    """
     if not (isinstance(mean, (float, int))) and not isinstance(mean, DNDarray):
         raise TypeError("'mean' must be float or DNDarray")
     if not (isinstance(std, (float, int))) and not isinstance(std, DNDarray):
@@ -318,7 +304,12 @@ def normal(
     ):
         raise ValueError("'std' must be non-negative")
 
-    return mean + std * standard_normal(shape, dtype, split, device, comm)
+    if not shape:
+        shape = (1,)
+    shape = stride_tricks.sanitize_shape(shape)
+    values, counter = _randn(shape, dtype, split, device, comm, key, counter)
+
+    return mean + std * values, counter
 
 
 def permutation(x: Union[int, DNDarray]) -> DNDarray:
@@ -354,39 +345,44 @@ def permutation(x: Union[int, DNDarray]) -> DNDarray:
         raise TypeError("x must be int or DNDarray")
 
     # random permutation
-    recv = torch.randperm(x.shape[0], device=x.device.torch_device)
+    perm = torch.randperm(x.shape[0], device=x.device.torch_device)
 
     # rearrange locally
-    if (x.split is None) or (x.split != 0):
-        return x[recv]
-
-    # split == 0 -> need for communication
-    if x.lshape[0] > 0:
-        cumsum = [x.comm.chunk(x.gshape, 0, i)[0] for i in range(0, x.comm.size)]
-        cumsum.append(x.shape[0])
-
-        send = torch.argsort(recv)
-        size = cumsum[x.comm.rank + 1] - cumsum[x.comm.rank]
-        torch_cumsum = torch.tensor(cumsum, device=x.device.torch_device)
-
-        buf = []
-        requests = []
-
-        for i in range(size):
-            proc_recv = torch.where(recv[torch_cumsum[x.comm.rank] + i] < torch_cumsum)[0][0] - 1
-            buf.append(torch.empty_like(x.lloc[i]))
-            requests.append(x.comm.Irecv(buf[-1], proc_recv, tag=i))
+    if not x.is_distributed() or x.split != 0:
+        return x[perm]
+
+    # split == 0 -> every row is sent to the process holding its target position, the result keeps the distribution
+    # of x. The rows are bucketed by target process and exchanged with a single Alltoallv.
+    counts, displs = x.counts_displs()
+    bounds = torch.tensor(displs[1:], device=perm.device)
+    rank = x.comm.rank
+
+    # target positions of the local rows
+    target = torch.empty_like(perm)
+    target[perm] = torch.arange(x.shape[0], device=perm.device)
+    target = target[displs[rank] : displs[rank] + counts[rank]]
+    send_order = torch.argsort(target)
+    send_counts = torch.bincount(
+        torch.bucketize(target, bounds, right=True), minlength=x.comm.size
+    ).tolist()
+
+    # source positions of the local result rows, they arrive ordered by source process and target position
+    source_ranks = torch.bucketize(
+        perm[displs[rank] : displs[rank] + counts[rank]], bounds, right=True
+    )
+    recv_counts = torch.bincount(source_ranks, minlength=x.comm.size).tolist()
+    recv_order = torch.argsort(
+        source_ranks * counts[rank] + torch.arange(counts[rank], device=perm.device)
+    )
 
-            proc_send = torch.where(send[torch_cumsum[x.comm.rank] + i] < torch_cumsum)[0][0] - 1
-            tag = send[torch_cumsum[x.comm.rank] + i] - torch_cumsum[proc_send]
-            requests.append(x.comm.Isend(x.lloc[i].clone(), proc_send, tag=tag))
+    send_buf = x.larray[send_order]
+    recv_buf = torch.empty_like(send_buf)
+    send_displs = [0] + torch.tensor(send_counts).cumsum(0)[:-1].tolist()
+    recv_displs = [0] + torch.tensor(recv_counts).cumsum(0)[:-1].tolist()
+    x.comm.Alltoallv((send_buf, send_counts, send_displs), (recv_buf, recv_counts, recv_displs))
 
-        for req in requests:
-            req.Wait()
-
-        data = torch.stack(buf)
-    else:
-        data = torch.empty_like(x.larray)
+    data = torch.empty_like(recv_buf)
+    data[recv_order] = recv_buf
 
     return DNDarray(
         data,
@@ -395,7 +391,7 @@ def permutation(x: Union[int, DNDarray]) -> DNDarray:
         split=x.split,
         device=x.device,
         comm=x.comm,
-        balanced=x.is_balanced,
+        balanced=x.balanced,
     )
 
 
@@ -437,6 +433,41 @@ def rand(
     >>> ht.rand(3)
     DNDarray([0.1921, 0.9635, 0.5047], dtype=ht.float32, device=cpu:0, split=None)
     """
+    global __counter
+    values, __counter = _uniform(args, dtype, split, device, comm, (__seed, __seed), __counter)
+
+    return values
+
+
+def _uniform(
+    args: Tuple[int, ...],
+    dtype: Type[datatype],
+    split: Optional[int],
+    device: Optional[Device],
+    comm: Optional[Communication],
+    key: Tuple[int, int],
+    counter: int,
+) -> Tuple[DNDarray, int]:
+    """
+    Implementation of :func:`rand` for an explicit generator state. Returns the random values and the advanced counter.
+
+    Parameters
+    ----------
+    args : Tuple[int, ...]
+        The dimensions of the returned array
+    dtype : Type[datatype]
+        The datatype of the returned values, :class:`~heat.core.types.float32` or :class:`~heat.core.types.float64`.
+    split : int or None
+        The axis along which the array is split and distributed
+    device : str or None
+        Specifies the :class:`~heat.core.devices.Device` the array shall be allocated on
+    comm : Communication or None
+        Handle to the nodes holding distributed parts or copies of this array.
+    key : Tuple[int, int]
+        The Threefry key, i.e. seed and stream
+    counter : int
+        The counter state of the generator
+    """
     # if args are not set, generate a single sample
     if not args:
         args = (1,)
@@ -452,28 +483,26 @@ def rand(
     comm = communication.sanitize_comm(comm)
     balanced = True
 
-    # generate the random sequence
+    # generate the random sequence and convert the values to floats
     if dtype == types.float32:
-        x_0, x_1, lshape, lslice = __counter_sequence(shape, torch.int32, split, device, comm)
-        x_0, x_1 = __threefry32(x_0, x_1, seed=__seed)
-
-        # combine the values into one tensor and convert them to floats
-        values = __int32_to_float32(torch.stack([x_0, x_1], dim=1).flatten()[lslice]).reshape(
-            lshape
+        x_0, x_1, lshape, lslice, counter = __counter_sequence(
+            shape, torch.int32, split, device, comm, counter
         )
+        __threefry32(x_0, x_1, key)
+        values = torch.stack([x_0, x_1], dim=1).view(-1)[lslice].view(lshape)
+        values = __int32_to_float32(values)
     elif dtype == types.float64:
-        x_0, x_1, lshape, lslice = __counter_sequence(shape, torch.int64, split, device, comm)
-        x_0, x_1 = __threefry64(x_0, x_1, seed=__seed)
-
-        # combine the values into one tensor and convert them to floats
-        values = __int64_to_float64(torch.stack([x_0, x_1], dim=1).flatten()[lslice]).reshape(
-            lshape
+        x_0, x_1, lshape, lslice, counter = __counter_sequence(
+            shape, torch.int64, split, device, comm, counter
         )
+        __threefry64(x_0, x_1, key)
+        values = torch.stack([x_0, x_1], dim=1).view(-1)[lslice].view(lshape)
+        values = __int64_to_float64(values)
     else:
         # Unsupported type
         raise ValueError(f"dtype is none of ht.float32 or ht.float64 but was {dtype}")
 
-    return DNDarray(values, shape, dtype, split, device, comm, balanced)
+    return DNDarray(values, shape, dtype, split, device, comm, balanced), counter
 
 
 def randint(
@@ -522,6 +551,50 @@ def randint(
     >>> ht.randint(3)
     DNDarray([4, 101, 16], dtype=ht.int32, device=cpu:0, split=None)
     """
+    global __counter
+    values, __counter = _randint(
+        low, high, size, dtype, split, device, comm, (__seed, __seed), __counter
+    )
+
+    return values
+
+
+def _randint(
+    low: int,
+    high: Optional[int],
+    size: Optional[Union[int, Tuple[int]]],
+    dtype: Optional[Type[datatype]],
+    split: Optional[int],
+    device: Optional[str],
+    comm: Optional[Communication],
+    key: Tuple[int, int],
+    counter: int,
+) -> Tuple[DNDarray, int]:
+    """
+    Implementation of :func:`randint` for an explicit generator state. Returns the random values and the advanced
+    counter.
+
+    Parameters
+    ----------
+    low : int
+        Lowest (signed) integer to be drawn from the distribution, or one above the highest if ``high`` is None
+    high : int or None
+        One above the largest (signed) integer to be drawn from the distribution
+    size : int or Tuple[int,...] or None
+        Output shape
+    dtype : datatype or None
+        Desired datatype of the result, int32 or int64
+    split : int or None
+        The axis along which the array is split and distributed
+    device : str or None
+        Specifies the :class:`~heat.core.devices.Device` the array shall be allocated on
+    comm : Communication or None
+        Handle to the nodes holding distributed parts or copies of this array.
+    key : Tuple[int, int]
+        The Threefry key, i.e. seed and stream
+    counter : int
+        The counter state of the generator
+    """
     # determine range bounds
     if high is None:
         low, high = 0, int(low)
@@ -557,18 +630,20 @@ def randint(
     balanced = True
 
     # generate the random sequence
-    x_0, x_1, lshape, lslice = __counter_sequence(shape, dtype.torch_type(), split, device, comm)
+    x_0, x_1, lshape, lslice, counter = __counter_sequence(
+        shape, torch_dtype, split, device, comm, counter
+    )
     if torch_dtype is torch.int32:
-        x_0, x_1 = __threefry32(x_0, x_1, seed=__seed)
+        __threefry32(x_0, x_1, key)
     else:  # torch.int64
-        x_0, x_1 = __threefry64(x_0, x_1, seed=__seed)
+        __threefry64(x_0, x_1, key)
 
-    # stack the resulting sequence and normalize to given range
-    values = torch.stack([x_0, x_1], dim=1).flatten()[lslice].reshape(lshape)
+    # interleave the resulting sequence and normalize to given range
+    values = torch.stack([x_0, x_1], dim=1).view(-1)[lslice].view(lshape)
     # ATTENTION: this is biased and known, bias-free rejection sampling is difficult to do in parallel
-    values = (values.abs_() % span) + low
+    values.abs_().remainder_(span).add_(low)
 
-    return DNDarray(values, shape, dtype, split, device, comm, balanced)
+    return DNDarray(values, shape, dtype, split, device, comm, balanced), counter
 
 
 # alias
@@ -636,12 +711,48 @@ def randn(
               [ 1.3365, -1.5212,  1.4159, -0.1671],
               [ 0.1260,  1.2126, -0.0804,  0.0907]], dtype=ht.float32, device=cpu:0, split=None)
     """
+    global __counter
+    values, __counter = _randn(args, dtype, split, device, comm, (__seed, __seed), __counter)
+
+    return values
+
+
+def _randn(
+    args: Tuple[int, ...],
+    dtype: Type[datatype],
+    split: Optional[int],
+    device: Optional[str],
+    comm: Optional[Communication],
+    key: Tuple[int, int],
+    counter: int,
+) -> Tuple[DNDarray, int]:
+    """
+    Implementation of :func:`randn` for an explicit generator state. Returns the random values and the advanced
+    counter.
+
+    Parameters
+    ----------
+    args : Tuple[int, ...]
+        The dimensions of the returned array
+    dtype : Type[datatype]
+        The datatype of the returned values, :class:`~heat.core.types.float32` or :class:`~heat.core.types.float64`.
+    split : int or None
+        The axis along which the array is split and distributed
+    device : str or None
+        Specifies the :class:`~heat.core.devices.Device` the array shall be allocated on
+    comm : Communication or None
+        Handle to the nodes holding distributed parts or copies of this array.
+    key : Tuple[int, int]
+        The Threefry key, i.e. seed and stream
+    counter : int
+        The counter state of the generator
+    """
     # generate uniformly distributed random numbers first
-    normal_tensor = rand(*args, dtype=dtype, split=split, device=device, comm=comm)
+    normal_tensor, counter = _uniform(args, dtype, split, device, comm, key, counter)
     # convert the the values to a normal distribution using the Kundu transform
     normal_tensor.larray = __kundu_transform(normal_tensor.larray)
 
-    return normal_tensor
+    return normal_tensor, counter
 
 
 def randperm(
@@ -661,7 +772,8 @@ def randperm(
     dtype : datatype, optional
         The datatype of the returned values.
     split : int, optional
-        The axis along which the array is split and distributed, defaults to no distribution.
+        The axis along which the array is split and distributed, defaults to no distribution. A split permutation is
+        generated in parallel, no process holds the entire permutation at any time.
     device : str, optional
         Specifies the :class:`~heat.core.devices.Device`  the array shall be allocated on, defaults to globally
         set default device.
@@ -683,9 +795,45 @@ def randperm(
 
     device = devices.sanitize_device(device)
     comm = communication.sanitize_comm(comm)
-    perm = torch.randperm(n, dtype=dtype.torch_type(), device=device.torch_device)
+    split = stride_tricks.sanitize_axis((n,), split)
+    if split is None or not comm.is_distributed():
+        perm = torch.randperm(n, dtype=dtype.torch_type(), device=device.torch_device)
+        return factories.array(perm, dtype=dtype, device=device, split=split, comm=comm)
+
+    # split == 0 -> every process shuffles its chunk of the range and exchanges contiguous parts of it with a single
+    # Alltoallv, the sizes of the parts are drawn from the multivariate hypergeometric distribution with a common
+    # seed taken from the process-consistent Threefry generator. A local shuffle of the received values completes a
+    # uniformly random permutation.
+    seed = randint(0, 2**31 - 1, device=device, comm=comm).item()
+    counts = np.array([comm.chunk((n,), 0, rank=i)[1][0] for i in range(comm.size)])
+    rng = np.random.default_rng(seed)
+    remaining = counts.copy()
+    table = np.zeros((comm.size, comm.size), dtype=np.int64)
+    for i in range(comm.size - 1):
+        table[i] = rng.multivariate_hypergeometric(remaining, counts[i])
+        remaining -= table[i]
+    table[-1] = remaining
+
+    offset, lshape, _ = comm.chunk((n,), 0)
+    generator = torch.Generator().manual_seed(seed + comm.rank + 1)
+    local = offset + torch.randperm(lshape[0], generator=generator)
+    send_counts = table[comm.rank].tolist()
+    recv_counts = table[:, comm.rank].tolist()
+    send_displs = [0] + np.cumsum(send_counts[:-1]).tolist()
+    recv_displs = [0] + np.cumsum(recv_counts[:-1]).tolist()
+    received = torch.empty_like(local)
+    comm.Alltoallv((local, send_counts, send_displs), (received, recv_counts, recv_displs))
+    perm = received[torch.randperm(lshape[0], generator=generator)]
 
-    return factories.array(perm, dtype=dtype, device=device, split=split, comm=comm)
+    return DNDarray(
+        perm.to(dtype=dtype.torch_type(), device=device.torch_device),
+        gshape=(n,),
+        dtype=dtype,
+        split=split,
+        device=device,
+        comm=comm,
+        balanced=True,
+    )
 
 
 def random(
@@ -871,12 +1019,10 @@ def standard_normal(
     return randn(*shape, dtype=dtype, split=split, device=device, comm=comm)
 
 
-def __threefry32(
-    x0: torch.Tensor, x1: torch.Tensor, seed: int
-) -> Tuple[torch.Tensor, torch.Tensor]:
+def __threefry32(x0: torch.Tensor, x1: torch.Tensor, key: Tuple[int, int]):
     """
-    Counter-based pseudo random number generator. Based on a 12-round Threefry "encryption" algorithm [1]. Returns
-    Two vectors with num_samples / 2 (rounded-up) pseudo random numbers. This is the 32-bit version.
+    Counter-based pseudo random number generator. Based on a 12-round Threefry "encryption" algorithm [1]. Encrypts the
+    pairs of ``x0`` and ``x1`` in-place. This is the 32-bit version.
 
     Parameters
     ----------
@@ -884,8 +1030,8 @@ def __threefry32(
         Upper bits of the to be encoded random sequence
     x1 : torch.Tensor
         Lower bits of the to be encoded random sequence
-    seed : int
-        The seed, i.e. key, for the threefry32 encryption
+    key : Tuple[int, int]
+        The key for the threefry32 encryption, i.e. the seed and the stream of the generator
 
     References
     ----------
@@ -893,92 +1039,25 @@ def __threefry32(
     3", Proceedings of 2011 International Conference for High Performance Computing, Networking, Storage and Analysis,
     p. 16, 2011
     """
-    samples = len(x0)
-
-    # Seed is > 32 bit
-    seed_32 = seed & 0x7FFFFFFF
-
-    # set up key buffer
-    ks_0 = torch.full((samples,), seed_32, dtype=torch.int32, device=x0.device)
-    ks_1 = torch.full((samples,), seed_32, dtype=torch.int32, device=x1.device)
-    ks_2 = torch.full((samples,), 466688986, dtype=torch.int32, device=x0.device)
-    # ks_2 ^= ks_0
-    # ks_2 ^= ks_1
-    ks_2 = torch.bitwise_xor(torch.bitwise_xor(ks_2, ks_0), ks_1)
-
-    # initialize output using the key
-    x0 += ks_0
-    x1 += ks_1
-
-    # perform rounds
-    # round 1
-    x0 += x1
-    x1 = (x1 << 13) | ((x1 >> 19) & 0x1FFF)
-    x1 = torch.bitwise_xor(x1, x0)
-    # x1 ^= x0
-    # round 2
-    x0 += x1
-    x1 = (x1 << 15) | ((x1 >> 17) & 0x7FFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 3
-    x0 += x1
-    x1 = (x1 << 26) | ((x1 >> 6) & 0x3FFFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 4
-    x0 += x1
-    x1 = (x1 << 6) | ((x1 >> 26) & 0x3F)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-
-    # inject key
-    x0 += ks_1
-    x1 += ks_2 + 1
-
-    # round 5
-    x0 += x1
-    x1 = (x1 << 17) | ((x1 >> 15) & 0x1FFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 6
-    x0 += x1
-    x1 = (x1 << 29) | ((x1 >> 3) & 0x1FFFFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 7
-    x0 += x1
-    x1 = (x1 << 16) | ((x1 >> 16) & 0xFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 8
-    x0 += x1
-    x1 = (x1 << 24) | ((x1 >> 8) & 0xFFFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-
-    # inject key
-    # x0 += ks_2; x1 += (ks_0 + 2)
-    #
-    # x0 += x1; x1 = (x1 << 13) | (x1 >> 19); x1 ^= x0  # round 9
-    # x0 += x1; x1 = (x1 << 15) | (x1 >> 17); x1 ^= x0  # round 10
-    # x0 += x1; x1 = (x1 << 26) | (x1 >>  6); x1 ^= x0  # round 11
-    # x0 += x1; x1 = (x1 <<  6) | (x1 >> 26); x1 ^= x0  # round 12
-
-    # inject key
-    x0 += ks_0
-    x1 += ks_1 + 3
-
-    return x0, x1
+    # key is > 32 bit
+    ks_0 = key[0] & 0x7FFFFFFF
+    ks_1 = key[1] & 0x7FFFFFFF
+    ks_2 = 466688986 ^ ks_0 ^ ks_1
+    injections = [ks_0, ks_1, ks_1, ks_2 + 1, ks_0, ks_1 + 3]
+
+    __threefry_rounds(
+        x0,
+        x1,
+        [__wrap(value, 32) for value in injections],
+        [13, 15, 26, 6, 17, 29, 16, 24],
+        32,
+    )
 
 
-# @torch.jit.script
-def __threefry64(
-    x0: torch.Tensor, x1: torch.Tensor, seed: int
-) -> Tuple[torch.Tensor, torch.Tensor]:
+def __threefry64(x0: torch.Tensor, x1: torch.Tensor, key: Tuple[int, int]):
     """
-    Counter-based pseudo random number generator. Based on a 12-round Threefry "encryption" algorithm [1]. This is the
-    64-bit version.
+    Counter-based pseudo random number generator. Based on a 12-round Threefry "encryption" algorithm [1]. Encrypts the
+    pairs of ``x0`` and ``x1`` in-place. This is the 64-bit version.
 
     Parameters
     ----------
@@ -986,8 +1065,8 @@ def __threefry64(
         Upper bits of the to be encoded random sequence
     x1 : torch.Tensor
         Lower bits of the to be encoded random sequence
-    seed : int
-        The seed, i.e. key, for the threefry64 encryption
+    key : Tuple[int, int]
+        The key for the threefry64 encryption, i.e. the seed and the stream of the generator
 
     References
     ----------
@@ -995,80 +1074,259 @@ def __threefry64(
     3", Proceedings of 2011 International Conference for High Performance Computing, Networking, Storage and Analysis,
     p. 16, 2011
     """
-    samples = len(x0)
+    ks_0 = key[0]
+    ks_1 = key[1]
+    ks_2 = 2004413935125273122 ^ ks_0 ^ ks_1
+    injections = [ks_0, ks_1, ks_1, ks_2 + 1, ks_0, ks_1 + 3]
+
+    __threefry_rounds(
+        x0,
+        x1,
+        [__wrap(value, 64) for value in injections],
+        [16, 42, 12, 31, 16, 32, 24, 21],
+        64,
+    )
 
-    # set up key buffer
-    ks_0 = torch.full((samples,), seed, dtype=torch.int64, device=x0.device)
-    ks_1 = torch.full((samples,), seed, dtype=torch.int64, device=x1.device)
-    ks_2 = torch.full((samples,), 2004413935125273122, dtype=torch.int64, device=x0.device)
-    # ks_2 ^= ks_0
-    # ks_2 ^= ks_1
-    ks_2 = torch.bitwise_xor(torch.bitwise_xor(ks_2, ks_0), ks_1)
 
-    # initialize output using the key
-    x0 += ks_0
-    x1 += ks_1
-
-    # perform rounds
-    # round 1
-    x0 += x1
-    x1 = (x1 << 16) | ((x1 >> 48) & 0xFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 2
-    x0 += x1
-    x1 = (x1 << 42) | ((x1 >> 22) & 0x3FFFFFFFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 3
-    x0 += x1
-    x1 = (x1 << 12) | ((x1 >> 52) & 0xFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 4
-    x0 += x1
-    x1 = (x1 << 31) | ((x1 >> 33) & 0x7FFFFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
+def __threefry_rounds(
+    x0: torch.Tensor, x1: torch.Tensor, injections: List[int], rotations: List[int], bits: int
+):
+    """
+    The eight rounds of the Threefry encryption with the key injections in between. ``x0`` and ``x1`` are modified
+    in-place, the keys are scalars, i.e. no temporary tensors besides one for the rotation are allocated. The key
+    injections need to be representable by the data type of ``x0`` and ``x1``.
 
+    Parameters
+    ----------
+    x0 : torch.Tensor
+        Upper bits of the to be encoded random sequence
+    x1 : torch.Tensor
+        Lower bits of the to be encoded random sequence
+    injections : List[int]
+        The three key injections, each for ``x0`` and ``x1``
+    rotations : List[int]
+        The rotation distances of the eight rounds
+    bits : int
+        The number of bits of the data type
+    """
+    # initialize output using the key
+    x0 += injections[0]
+    x1 += injections[1]
+    for i, r in enumerate(rotations):
+        if i == 4:
+            # inject key
+            x0 += injections[2]
+            x1 += injections[3]
+        # x0 += x1; x1 = rotate_left(x1, r); x1 ^= x0
+        x0 += x1
+        high = x1 >> (bits - r)
+        high &= (1 << r) - 1
+        x1 <<= r
+        x1 |= high
+        x1 ^= x0
     # inject key
-    x0 += ks_1
-    x1 += ks_2 + 1
-
-    # round 5
-    x0 += x1
-    x1 = (x1 << 16) | ((x1 >> 48) & 0xFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 6
-    x0 += x1
-    x1 = (x1 << 32) | ((x1 >> 32) & 0xFFFFFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 7
-    x0 += x1
-    x1 = (x1 << 24) | ((x1 >> 40) & 0xFFFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
-    # round 8
-    x0 += x1
-    x1 = (x1 << 21) | ((x1 >> 43) & 0x1FFFFF)
-    # x1 ^= x0
-    x1 = torch.bitwise_xor(x1, x0)
+    x0 += injections[4]
+    x1 += injections[5]
 
-    # inject key
-    # x0 += ks_2; x1 += (ks_0 + 2)
-    #
-    # x0 += x1; x1 = (x1 << 16) | (x1 >> 48); x1 ^= x0  # round 9
-    # x0 += x1; x1 = (x1 << 42) | (x1 >> 22); x1 ^= x0  # round 10
-    # x0 += x1; x1 = (x1 << 12) | (x1 >> 52); x1 ^= x0  # round 11
-    # x0 += x1; x1 = (x1 << 31) | (x1 >> 33); x1 ^= x0  # round 12
 
-    # inject key
-    x0 += ks_0
-    x1 += ks_1 + 3
+def __wrap(value: int, bits: int) -> int:
+    """
+    Maps an arbitrary integer to the signed integer with the given number of bits that has the same binary
+    representation modulo :math:`2^{bits}`.
+
+    Parameters
+    ----------
+    value : int
+        The integer to be wrapped
+    bits : int
+        The number of bits of the signed integer, 32 or 64
+    """
+    value &= (1 << bits) - 1
+    return value - (1 << bits) if value >> (bits - 1) else value
+
 
-    return x0, x1
+class Generator:
+    """
+    An independent stream of the counter-based Threefry pseudo random number generator. The random numbers of a
+    ``Generator`` only depend on its seed, its stream id and its counter. Generators with different stream ids yield
+    independent sequences, drawing from or advancing one of them does not affect any other generator, in particular
+    not the global generator of :mod:`heat.random`. The stream ``0`` reproduces the global generator seeded with the
+    same seed. Like the global generator, the values are independent of the number of processes.
+
+    Parameters
+    ----------
+    seed : int, optional
+        The seed of the generator, if not set a time-based seed is generated.
+    stream_id : int, optional
+        The id of the stream, must be in :math:`[0, 2^{31})`.
+
+    Examples
+    --------
+    >>> streams = [ht.random.Generator(42, stream_id=i) for i in range(2)]
+    >>> streams[0].rand(3)
+    DNDarray([0.0805, 0.1951, 0.1637], dtype=ht.float32, device=cpu:0, split=None)
+    >>> streams[1].rand(3)
+    DNDarray([0.7387, 0.0829, 0.3458], dtype=ht.float32, device=cpu:0, split=None)
+    >>> streams[1].advance(10**12)
+    """
+
+    def __init__(self, seed: Optional[int] = None, stream_id: int = 0):
+        if seed is None:
+            seed = communication.MPI_WORLD.bcast(int(time.time() * 256))
+        if not isinstance(seed, int) or not isinstance(stream_id, int):
+            raise TypeError(
+                f"seed and stream_id must be integers, but were {type(seed)}, {type(stream_id)}"
+            )
+        if not 0 <= stream_id < 2**31:
+            raise ValueError(f"stream_id must be in [0, 2**31), but was {stream_id}")
+
+        self.__seed = seed
+        self.__stream_id = stream_id
+        self.__counter = 0
+
+    @property
+    def seed(self) -> int:
+        """
+        The seed of the generator
+        """
+        return self.__seed
+
+    @property
+    def stream_id(self) -> int:
+        """
+        The id of the stream
+        """
+        return self.__stream_id
+
+    @property
+    def counter(self) -> int:
+        """
+        The internal counter, i.e. the number of already used Threefry blocks. Each block yields two random numbers.
+        """
+        return self.__counter
+
+    @property
+    def __key(self) -> Tuple[int, int]:
+        return self.__seed, self.__seed + self.__stream_id
+
+    def advance(self, delta: int):
+        """
+        Jumps ahead in the stream by ``delta`` Threefry blocks without generating any numbers. Drawing :math:`n`
+        random numbers advances the counter by :math:`\\lceil n / 2 \\rceil` blocks.
+
+        Parameters
+        ----------
+        delta : int
+            The number of blocks to skip, must be non-negative
+        """
+        if not isinstance(delta, int) or delta < 0:
+            raise ValueError(f"delta must be a non-negative integer, but was {delta}")
+        self.__counter = (self.__counter + delta) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+
+    def normal(
+        self,
+        mean: Union[float, DNDarray] = 0.0,
+        std: Union[float, DNDarray] = 1.0,
+        shape: Optional[Tuple[int, ...]] = None,
+        dtype: Type[datatype] = types.float32,
+        split: Optional[int] = None,
+        device: Optional[str] = None,
+        comm: Optional[Communication] = None,
+    ) -> DNDarray:
+        """
+        Same as :func:`heat.random.normal <heat.core.random.normal>`, drawn from this stream.
+        """
+        values, self.__counter = _normal(
+            mean, std, shape, dtype, split, device, comm, self.__key, self.__counter
+        )
+        return values
+
+    def rand(
+        self,
+        *args: List[int],
+        dtype: Type[datatype] = types.float32,
+        split: Optional[int] = None,
+        device: Optional[Device] = None,
+        comm: Optional[Communication] = None,
+    ) -> DNDarray:
+        """
+        Same as :func:`heat.random.rand <heat.core.random.rand>`, drawn from this stream.
+        """
+        values, self.__counter = _uniform(
+            args, dtype, split, device, comm, self.__key, self.__counter
+        )
+        return values
+
+    def randint(
+        self,
+        low: int,
+        high: Optional[int] = None,
+        size: Optional[Union[int, Tuple[int]]] = None,
+        dtype: Optional[Type[datatype]] = types.int32,
+        split: Optional[int] = None,
+        device: Optional[str] = None,
+        comm: Optional[Communication] = None,
+    ) -> DNDarray:
+        """
+        Same as :func:`heat.random.randint <heat.core.random.randint>`, drawn from this stream.
+        """
+        values, self.__counter = _randint(
+            low, high, size, dtype, split, device, comm, self.__key, self.__counter
+        )
+        return values
+
+    def randn(
+        self,
+        *args: List[int],
+        dtype: Type[datatype] = types.float32,
+        split: Optional[int] = None,
+        device: Optional[str] = None,
+        comm: Optional[Communication] = None,
+    ) -> DNDarray:
+        """
+        Same as :func:`heat.random.randn <heat.core.random.randn>`, drawn from this stream.
+        """
+        values, self.__counter = _randn(
+            args, dtype, split, device, comm, self.__key, self.__counter
+        )
+        return values
+
+    def random(
+        self,
+        shape: Optional[Tuple[int]] = None,
+        dtype: Type[datatype] = types.float32,
+        split: Optional[int] = None,
+        device: Optional[str] = None,
+        comm: Optional[Communication] = None,
+    ) -> DNDarray:
+        """
+        Same as :func:`heat.random.random <heat.core.random.random>`, drawn from this stream.
+        """
+        if not shape:
+            shape = (1,)
+        shape = stride_tricks.sanitize_shape(shape)
+        return self.rand(*shape, dtype=dtype, split=split, device=device, comm=comm)
+
+    def standard_normal(
+        self,
+        shape: Optional[Tuple[int, ...]] = None,
+        dtype: Type[datatype] = types.float32,
+        split: Optional[int] = None,
+        device: Optional[str] = None,
+        comm: Optional[Communication] = None,
+    ) -> DNDarray:
+        """
+        Same as :func:`heat.random.standard_normal <heat.core.random.standard_normal>`, drawn from this stream.
+        """
+        if not shape:
+            shape = (1,)
+        shape = stride_tricks.sanitize_shape(shape)
+        return self.randn(*shape, dtype=dtype, split=split, device=device, comm=comm)
+
+    def __repr__(self) -> str:
+        return (
+            f"Generator(seed={self.__seed}, stream_id={self.__stream_id}, counter={self.__counter})"
+        )
 
 
 # roll a global time-based seed
@@ -532,6 +532,69 @@ class TestDNDarray(TestCase):
             with self.assertRaises(TypeError):
                 float(ht.full((ht.MPI_WORLD.size,), 2, split=0))
 
+    def test_index_put_(self):
+        size = ht.MPI_WORLD.size
+        n = 3 * size + 2
+        keys = torch.tensor([0, n - 1, n - 1, 1, -1, 2, 2, 2], device=self.device.torch_device)
+        values = torch.arange(16.0, device=self.device.torch_device).reshape(8, 2)
+        for split in [None, 0]:
+            for key_split in [None, 0]:
+                key = ht.array(keys, split=key_split)
+                # histogram-style accumulation
+                x = ht.zeros(n, split=split)
+                self.assertIs(x.index_put_(key, 1.0, mode="add"), x)
+                expected = torch.bincount(keys % n, minlength=n).float()
+                self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+
+                # rows of values
+                x = ht.zeros((n, 2), split=split)
+                x.index_put_(key, ht.array(values, split=key_split), mode="add")
+                expected = torch.zeros((n, 2), device=self.device.torch_device)
+                expected.index_put_((keys,), values, accumulate=True)
+                self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+
+                x = ht.full((n, 2), 5.0, split=split)
+                x.index_put_(key, ht.array(values, split=key_split), mode="max")
+                expected = torch.full((n, 2), 5.0, device=self.device.torch_device)
+                for i, k in enumerate(keys.tolist()):
+                    expected[k] = torch.maximum(expected[k], values[i])
+                self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+
+                # masks
+                mask = ht.array(torch.arange(n) % 2 == 0, split=key_split)
+                x = ht.ones((n, 2), split=split)
+                x.index_put_(mask, torch.tensor([1.0, 2.0]), mode="add")
+                expected = torch.ones((n, 2), device=self.device.torch_device)
+                expected[torch.arange(n) % 2 == 0] += torch.tensor([1.0, 2.0])
+                self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+
+                x = ht.zeros(n, split=split)
+                x.index_put_(mask, ht.arange(n, split=key_split)[mask], mode="max")
+                expected = torch.arange(n, device=self.device.torch_device).float()
+                expected[1::2] = 0
+                self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+
+                x = ht.zeros(n, split=split)
+                x.index_put_(keys[:4].tolist(), 3.0)
+                self.assertEqual(x.sum().item(), 9.0)
+
+        # exceptions
+        x = ht.zeros((n, 2), split=0)
+        with self.assertRaises(ValueError):
+            x.index_put_([0, 1], 1.0, mode="min")
+        with self.assertRaises(ValueError):
+            x.index_put_(ht.ones((n, 3), dtype=ht.bool), 1.0)
+        with self.assertRaises(ValueError):
+            x.index_put_(ht.ones((2, 2), dtype=ht.int64), 1.0)
+        with self.assertRaises(ValueError):
+            x.index_put_([0, 1], ht.ones((3, 2)))
+        with self.assertRaises(IndexError):
+            x.index_put_(ht.array([0, n], split=0), 1.0)
+        with self.assertRaises(IndexError):
+            ht.zeros(n).index_put_([n], 1.0)
+        with self.assertRaises(NotImplementedError):
+            ht.zeros((n, n), split=1).index_put_([0], 1.0)
+
     def test_int_cast(self):
         # simple scalar tensor
         a = ht.ones(1)
@@ -600,6 +663,26 @@ class TestDNDarray(TestCase):
         with self.assertRaises(ValueError):
             x.item()
 
+        # distributed single elements are broadcast from their owner, the array is not resplit
+        x = ht.array([[7]], split=1)
+        self.assertEqual(x.item(), 7)
+        self.assertEqual(x.split, 1)
+        size = ht.MPI_WORLD.size
+        x = ht.arange(3 * size + 1, split=0)
+        for i in [0, 3 * size, -2]:
+            self.assertEqual(x[i].item(), (3 * size + 1 + i) % (3 * size + 1))
+            self.assertEqual(x[i].split, None)
+        x = ht.array(torch.arange(6 * size).reshape(3, 2 * size), split=1)
+        self.assertEqual(x[2, 1].item(), 2 * (2 * size) + 1)
+        self.assertEqual(x[1, -1].shape, ())
+        row = x[1]
+        self.assertEqual(row.split, 0)
+        self.assertTrue(torch.equal(row.resplit(None).larray, torch.arange(2 * size, 4 * size)))
+        with self.assertRaises(IndexError):
+            x[3, 0]
+        with self.assertRaises(IndexError):
+            x[0, -2 * size - 1]
+
     def test_len(self):
         # vector
         a = ht.zeros((10,))
@@ -879,6 +962,27 @@ class TestDNDarray(TestCase):
             else:
                 self.assertEqual(st.lshape, (50, 81, 0))
 
+            # values keep their global order, for arbitrary source and target distributions
+            for split in [0, 1]:
+                data = ht.arange(7 * 5 * st.comm.size, split=None).reshape(
+                    (7 * st.comm.size, 5) if split == 0 else (5, 7 * st.comm.size)
+                )
+                st = ht.resplit(data, split)
+                if split == 0:
+                    # unbalanced, as after filtering
+                    st = st[st[:, 0] % 3 != 1]
+                expected = ht.resplit(st, None)
+                target_map = st.create_lshape_map()
+                target_map[:, split] = 0
+                target_map[-1, split] = st.shape[split] // 2
+                target_map[1, split] = st.shape[split] - st.shape[split] // 2
+                st.redistribute_(target_map=target_map)
+                self.assertEqual(st.lshape[split], target_map[st.comm.rank, split].item())
+                self.assertTrue(ht.equal(ht.resplit(st, None), expected))
+                st.balance_()
+                self.assertTrue(st.is_balanced(force_check=True))
+                self.assertTrue(ht.equal(ht.resplit(st, None), expected))
+
             st = ht.zeros((8, 8, 8), split=None)
             target_map = torch.zeros(
                 (st.comm.size, 3), dtype=torch.int, device=self.device.torch_device
@@ -1524,6 +1628,56 @@ class TestDNDarray(TestCase):
                     self.assertTrue(arr.shape == check.shape)
                     self.assertTrue(arr.lshape[new_dim] == 1)
 
+        # distributed boolean masks and index arrays
+        size = ht.MPI_WORLD.size
+        t = torch.arange(4 * 5 * size, device=self.device.torch_device).reshape(5 * size, 4)
+        x = ht.array(t, split=0)
+        rows = t[:, 0] % 3 == 0
+        y = x[ht.array(rows, split=0)]
+        self.assertEqual(y.split, 0)
+        self.assertTrue(torch.equal(y.resplit(None).larray, t[rows]))
+        y = x[x % 7 == 0]
+        self.assertEqual(y.shape, (int((t % 7 == 0).sum()),))
+        self.assertTrue(torch.equal(y.resplit(None).larray, t[t % 7 == 0]))
+        # mask with a different distribution than the array
+        mask = ht.array(rows, split=0)[1:]
+        y = x[:-1][mask]
+        self.assertTrue(torch.equal(y.resplit(None).larray, t[:-1][rows[1:]]))
+
+        idx = [5 * size - 1, 0, -1, 3, 3, 2, 1, 4 * size]
+        key = ht.array(idx, split=0)
+        y = x[key]
+        self.assertEqual(y.shape, (len(idx), 4))
+        self.assertEqual(y.split, 0)
+        self.assertEqual(y.lshape[0], key.lshape[0])
+        self.assertTrue(torch.equal(y.resplit(None).larray, t[idx]))
+        y = ht.array(t[:, 0], split=0)[key]
+        self.assertTrue(torch.equal(y.resplit(None).larray, t[idx, 0]))
+        y = x[ht.array([], dtype=ht.int64, split=0)]
+        self.assertEqual(y.shape, (0, 4))
+        if x.is_distributed():
+            with self.assertRaises(IndexError):
+                x[ht.array([0, 5 * size], split=0)]
+
+        # distributed assignment with masks and index arrays
+        x = ht.array(t.clone(), split=0)
+        x[x % 7 == 0] = -1
+        expected = t.clone()
+        expected[t % 7 == 0] = -1
+        self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+        selected = torch.arange(4 * int(rows.sum()), device=self.device.torch_device).reshape(-1, 4)
+        x = ht.array(t.clone(), split=0)
+        x[ht.array(rows, split=0)] = ht.array(selected, split=0)
+        expected = t.clone()
+        expected[rows] = selected
+        self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+        x = ht.array(t.clone(), split=0)
+        selected = -torch.arange(12, device=self.device.torch_device).reshape(3, 4)
+        x[key[1:4]] = ht.array(selected, split=0)
+        expected = t.clone()
+        expected[idx[1:4]] = selected
+        self.assertTrue(torch.equal(x.resplit(None).larray, expected))
+
     def test_size_gnumel(self):
         a = ht.zeros((10, 10, 10), split=None)
         self.assertEqual(a.size, 10 * 10 * 10)
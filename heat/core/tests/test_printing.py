@@ -145,6 +145,21 @@ class TestPrinting(TestCase):
             if dndarray.comm.rank == 0:
                 self.assertEqual(comparison, __str)
 
+        # unbalanced arrays are printed without rebalancing them
+        for split in [0, 1]:
+            for shape in [(40, 30), (4, 3)]:
+                x = ht.arange(2 * shape[0] * shape[1], split=split).reshape(
+                    (2 * shape[0], shape[1])
+                )
+                x = x.resplit(split)[shape[0] // 2 + 1 :] if split == 0 else x[: shape[0], 1:]
+                balanced = x.copy()
+                balanced.balance_()
+                lshape = x.lshape
+                __str = str(x)
+                self.assertEqual(x.lshape, lshape)
+                if x.comm.rank == 0:
+                    self.assertEqual(__str, str(balanced))
+
     def test_unsplit_below_threshold(self):
         dndarray = ht.arange(2 * 3 * 4).reshape((2, 3, 4))
         comparison = (
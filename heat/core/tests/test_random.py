@@ -6,6 +6,73 @@ from .test_suites.basic_test import TestCase
 
 
 class TestRandom(TestCase):
+    def test_generator(self):
+        # stream 0 reproduces the global generator
+        ht.random.seed(1234)
+        a = ht.random.rand(5, 7, split=0)
+        b = ht.random.randint(0, 100, (11,), split=0)
+        c = ht.random.randn(3, 4, dtype=ht.float64, split=1)
+        gen = ht.random.Generator(1234)
+        self.assertTrue(ht.equal(gen.rand(5, 7, split=0), a))
+        self.assertTrue(ht.equal(gen.randint(0, 100, (11,), split=0), b))
+        self.assertTrue(ht.equal(gen.randn(3, 4, dtype=ht.float64, split=1), c))
+        self.assertEqual(gen.counter, ht.random.get_state()[2])
+
+        # drawing from a generator does not touch the global state
+        state = ht.random.get_state()
+        gen.random((10,))
+        gen.standard_normal((2, 2))
+        gen.normal(1.0, 2.0, (4,))
+        self.assertEqual(ht.random.get_state(), state)
+
+        # the values are independent of the distribution
+        gen = ht.random.Generator(42, stream_id=3)
+        x = gen.rand(9, 5, split=None)
+        gen = ht.random.Generator(42, stream_id=3)
+        y = gen.rand(9, 5, split=0)
+        self.assertTrue(ht.equal(x, y))
+        self.assertEqual(y.split, 0)
+
+        # different streams yield different values
+        other = ht.random.Generator(42, stream_id=4).rand(9, 5)
+        self.assertFalse(ht.equal(x, other))
+
+        # advancing is equivalent to drawing
+        gen = ht.random.Generator(7, stream_id=1)
+        gen.rand(10)
+        skipped = ht.random.Generator(7, stream_id=1)
+        skipped.advance(5)
+        self.assertEqual(gen.counter, skipped.counter)
+        self.assertTrue(ht.equal(gen.randn(6, split=0), skipped.randn(6, split=0)))
+        self.assertTrue(ht.equal(gen.normal(2.0, 0.5, (3, 3)), skipped.normal(2.0, 0.5, (3, 3))))
+
+        # large jumps do not overlap with the start of the stream
+        gen = ht.random.Generator(7, stream_id=1)
+        gen.advance(2**40)
+        self.assertEqual(gen.counter, 2**40)
+        self.assertFalse(ht.equal(gen.rand(8), ht.random.Generator(7, stream_id=1).rand(8)))
+
+        # time-based seed is process-consistent
+        gen = ht.random.Generator()
+        seeds = ht.MPI_WORLD.allgather(gen.seed)
+        self.assertEqual(len(set(seeds)), 1)
+        self.assertEqual(gen.stream_id, 0)
+        self.assertIn("stream_id=0", repr(gen))
+
+        # exceptions
+        with self.assertRaises(TypeError):
+            ht.random.Generator(1.5)
+        with self.assertRaises(TypeError):
+            ht.random.Generator(1, stream_id="1")
+        with self.assertRaises(ValueError):
+            ht.random.Generator(1, stream_id=-1)
+        with self.assertRaises(ValueError):
+            ht.random.Generator(1, stream_id=2**31)
+        with self.assertRaises(ValueError):
+            ht.random.Generator(1).advance(-1)
+        with self.assertRaises(ValueError):
+            ht.random.Generator(1).normal(0.0, -1.0)
+
     def test_normal(self):
         shape = (3, 4, 6)
         ht.random.seed(2)
@@ -82,6 +149,14 @@ class TestRandom(TestCase):
         self.assertTrue((ht.resplit(c0).larray == c0_cmp).all())
         self.assertTrue((ht.resplit(c1).larray == c1_cmp).all())
 
+        # unbalanced input
+        g_arr = ht.arange(3 * ht.MPI_WORLD.size + 5, split=0)
+        g_arr = g_arr[g_arr % 3 != 1]
+        lshape = g_arr.lshape
+        g = ht.random.permutation(g_arr)
+        self.assertEqual(g.lshape, lshape)
+        self.assertTrue(torch.equal(ht.resplit(g).larray.sort()[0], ht.resplit(g_arr).larray))
+
         with self.assertRaises(TypeError):
             ht.random.permutation("abc")
 
@@ -428,19 +503,36 @@ class TestRandom(TestCase):
 
         # torch results to compare to
         a_cmp = torch.randperm(10, dtype=torch.int32, device=self.device.torch_device)
-        b_cmp = torch.randperm(4, dtype=torch.float32, device=self.device.torch_device)
-        c_cmp = torch.randperm(5, dtype=torch.int64, device=self.device.torch_device)
+        if b.comm.size == 1:
+            b_cmp = torch.randperm(4, dtype=torch.float32, device=self.device.torch_device)
+            c_cmp = torch.randperm(5, dtype=torch.int64, device=self.device.torch_device)
         d_cmp = torch.randperm(5, dtype=torch.float64, device=self.device.torch_device)
 
         self.assertEqual(a.dtype, ht.int32)
         self.assertTrue((a.larray == a_cmp).all())
         self.assertEqual(b.dtype, ht.float32)
-        self.assertTrue((ht.resplit(b).larray == b_cmp).all())
         self.assertEqual(c.dtype, ht.int64)
-        self.assertTrue((ht.resplit(c).larray == c_cmp).all())
+        if b.comm.size == 1:
+            self.assertTrue((ht.resplit(b).larray == b_cmp).all())
+            self.assertTrue((ht.resplit(c).larray == c_cmp).all())
         self.assertEqual(d.dtype, ht.float64)
         self.assertTrue((d.larray == d_cmp).all())
 
+        # split permutations are generated in parallel
+        n = 7 * ht.MPI_WORLD.size + 2
+        for perm in [b, c, ht.random.randperm(n, split=0)]:
+            self.assertEqual(perm.split, 0)
+            self.assertTrue(perm.is_balanced(force_check=True))
+            values = ht.resplit(perm).larray.sort()[0]
+            self.assertTrue(
+                (values == torch.arange(perm.shape[0], device=self.device.torch_device)).all()
+            )
+        ht.random.seed(12345)
+        e = ht.random.randperm(n, split=0)
+        ht.random.seed(12345)
+        f = ht.random.randperm(n, split=0)
+        self.assertTrue(ht.equal(e, f))
+
         with self.assertRaises(TypeError):
             ht.random.randperm("abc")
 
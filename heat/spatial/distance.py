@@ -4,13 +4,13 @@ Module for (pairwise) distance functions
 import torch
 import numpy as np
 from mpi4py import MPI
-from typing import Callable
+from typing import Callable, Tuple, Union
 
 from ..core import factories
 from ..core import types
 from ..core.dndarray import DNDarray
 
-__all__ = ["cdist", "manhattan", "rbf"]
+__all__ = ["cdist", "cdist_topk", "manhattan", "rbf"]
 
 
 def _euclidian(x: torch.tensor, y: torch.tensor) -> torch.tensor:
@@ -205,6 +205,187 @@ def manhattan(X: DNDarray, Y: DNDarray = None, expand: bool = False):
         return _dist(X, Y, lambda x, y: _manhattan(x, y))
 
 
+def cdist_topk(
+    X: DNDarray,
+    Y: DNDarray = None,
+    k: int = 1,
+    metric: Union[str, Callable] = "euclidean",
+    block_size: int = 2**24,
+) -> Tuple[DNDarray, DNDarray]:
+    """
+    Find the ``k`` nearest neighbors in ``Y`` of every row of ``X`` without forming the full distance matrix.
+    Returns a tuple ``(distances, indices)`` of 2D DNDarrays of size :math:`m \\times k`, sorted by increasing distance.
+    ``indices`` refer to the global row index in ``Y``. Both results are distributed like ``X``.
+
+    ``Y`` is processed tile-wise, at most ``block_size`` distances are held in memory at any time. Only a running top-k
+    per row of ``X`` is kept. If ``X`` and ``Y`` are both split along axis 0, the slabs of ``Y`` travel around a ring
+    of processes, the transfer of the next slab overlaps with the computation on the current one.
+
+    Parameters
+    ----------
+    X : DNDarray
+        2D array of size :math:`m \\times f`, split along axis 0 or not split
+    Y : DNDarray, optional
+        2D array of size :math:`n \\times f`, split along axis 0 or not split.
+        If ``Y`` is None, the neighbors are searched among the rows of ``X`` itself.
+    k : int, optional
+        Number of nearest neighbors, must be between 1 and :math:`n`
+    metric : str or Callable, optional
+        ``'euclidean'``, ``'manhattan'`` or a function calculating the pairwise distances of two 2D ``torch.Tensors``,
+        see :func:`_dist`.
+    block_size : int, optional
+        Maximal number of elements of a temporary distance tile.
+
+    Examples
+    --------
+    >>> X = ht.array([[0.0, 0.0], [1.0, 0.0], [5.0, 5.0]], split=0)
+    >>> distances, indices = ht.spatial.cdist_topk(X, k=2)
+    >>> indices
+    DNDarray([[0, 1],
+              [1, 0],
+              [2, 1]], dtype=ht.int64, device=cpu:0, split=0)
+    """
+    if Y is None:
+        Y = X
+    if len(X.shape) != 2 or len(Y.shape) != 2:
+        raise NotImplementedError(
+            f"Only 2D data matrices are supported, but input shapes were X: {X.shape}, Y: {Y.shape}"
+        )
+    if X.shape[1] != Y.shape[1]:
+        raise ValueError("Inputs must have same shape[1]")
+    if X.comm != Y.comm:
+        raise NotImplementedError("Differing communicators not supported")
+    if X.split not in (None, 0) or Y.split not in (None, 0):
+        raise NotImplementedError(
+            f"Input splits were X.split = {X.split}, Y.split = {Y.split}. Splittings other than 0 or None currently not supported."
+        )
+    if not isinstance(k, int) or not 1 <= k <= Y.shape[0]:
+        raise ValueError(f"k must be an integer between 1 and {Y.shape[0]}, but was {k}")
+    if isinstance(metric, str):
+        metrics = {"euclidean": _euclidian, "manhattan": _manhattan}
+        if metric not in metrics:
+            raise ValueError(
+                f"metric must be one of {list(metrics)} or a callable, but was {metric}"
+            )
+        metric = metrics[metric]
+
+    promoted_type = types.promote_types(X.dtype, Y.dtype)
+    promoted_type = types.promote_types(promoted_type, types.float32)
+    x_ = X.larray.to(promoted_type.torch_type())
+    y_ = Y.larray.to(promoted_type.torch_type())
+    comm = X.comm
+
+    values = torch.full((x_.shape[0], k), np.inf, dtype=x_.dtype, device=x_.device)
+    indices = torch.full((x_.shape[0], k), -1, dtype=torch.int64, device=x_.device)
+
+    if not Y.is_distributed():
+        _topk_update(x_, y_, 0, values, indices, metric, block_size)
+
+    elif X.split is None:
+        # every process searches its slab of Y, the candidates are merged afterwards
+        _, ydispl = Y.counts_displs()
+        _topk_update(x_, y_, ydispl[comm.rank], values, indices, metric, block_size)
+        all_values = torch.empty(
+            (comm.size * values.shape[0], k), dtype=values.dtype, device=values.device
+        )
+        all_indices = torch.empty_like(all_values, dtype=torch.int64)
+        comm.Allgather(values, all_values)
+        comm.Allgather(indices, all_indices)
+        all_values = all_values.view(comm.size, -1, k).transpose(0, 1).reshape(-1, comm.size * k)
+        all_indices = all_indices.view(comm.size, -1, k).transpose(0, 1).reshape(-1, comm.size * k)
+        values, position = torch.topk(all_values, k, dim=1, largest=False)
+        indices = all_indices.gather(1, position)
+
+    else:
+        # ring: in step s, every process holds the slab of Y of process rank - s
+        ycounts, ydispl = Y.counts_displs()
+        rank, size = comm.rank, comm.size
+        current = y_.contiguous()
+        for step in range(size):
+            owner = (rank - step) % size
+            if step < size - 1:
+                moving = torch.empty(
+                    (ycounts[(owner - 1) % size], y_.shape[1]), dtype=y_.dtype, device=y_.device
+                )
+                recv_request = comm.Irecv(moving, source=(rank - 1) % size, tag=step)
+                send_request = comm.Isend(current, dest=(rank + 1) % size, tag=step)
+            _topk_update(x_, current, ydispl[owner], values, indices, metric, block_size)
+            if step < size - 1:
+                send_request.Wait()
+                recv_request.Wait()
+                current = moving
+
+    distances = DNDarray(
+        values,
+        gshape=(X.shape[0], k),
+        dtype=promoted_type,
+        split=X.split,
+        device=X.device,
+        comm=comm,
+        balanced=X.balanced,
+    )
+    indices = DNDarray(
+        indices,
+        gshape=(X.shape[0], k),
+        dtype=types.int64,
+        split=X.split,
+        device=X.device,
+        comm=comm,
+        balanced=X.balanced,
+    )
+    return distances, indices
+
+
+def _topk_update(
+    x: torch.Tensor,
+    y: torch.Tensor,
+    offset: int,
+    values: torch.Tensor,
+    indices: torch.Tensor,
+    metric: Callable,
+    block_size: int,
+):
+    """
+    Merges the distances between ``x`` and ``y`` tile by tile into the running top-k ``values`` and ``indices`` of
+    every row of ``x``. Both are updated in-place.
+
+    Parameters
+    ----------
+    x : torch.Tensor
+        2D tensor of size :math:`m x f`
+    y : torch.Tensor
+        2D tensor of size :math:`n x f`
+    offset : int
+        Global row index of the first row of ``y``
+    values : torch.Tensor
+        Running top-k distances of size :math:`m x k`
+    indices : torch.Tensor
+        Global row indices of the running top-k of size :math:`m x k`
+    metric : Callable
+        The distance to be calculated between ``x`` and ``y``
+    block_size : int
+        Maximal number of elements of a distance tile
+    """
+    m, n = x.shape[0], y.shape[0]
+    if m == 0 or n == 0:
+        return
+    k = values.shape[1]
+    columns = min(n, max(1, block_size // m, int(block_size**0.5)))
+    rows = min(m, max(1, block_size // columns))
+    for start in range(0, n, columns):
+        end = min(start + columns, n)
+        tile_indices = torch.arange(offset + start, offset + end, device=x.device)
+        for row in range(0, m, rows):
+            stop = min(row + rows, m)
+            tile = metric(x[row:stop], y[start:end])
+            candidates = torch.cat((values[row:stop], tile), dim=1)
+            candidate_indices = torch.cat(
+                (indices[row:stop], tile_indices.expand(stop - row, -1)), dim=1
+            )
+            values[row:stop], position = torch.topk(candidates, k, dim=1, largest=False)
+            indices[row:stop] = candidate_indices.gather(1, position)
+
+
 def _dist(X: DNDarray, Y: DNDarray = None, metric: Callable = _euclidian) -> DNDarray:
     """
     Pairwise distance calculation between all elements along axis 0 of ``X`` and ``Y`` Returns 2D DNDarray of size :math: `m \\times n`
@@ -261,3 +261,59 @@ class TestDistances(TestCase):
         d = ht.spatial.cdist(B, quadratic_expansion=False)
         result = ht.array(res, dtype=ht.float64, split=0)
         self.assertTrue(ht.allclose(d, result, atol=1e-8))
+
+    def test_cdist_topk(self):
+        n = ht.communication.MPI_WORLD.size
+        ht.random.seed(42)
+        X = ht.random.randn(4 * n + 3, 5, dtype=ht.float64)
+        Y = ht.random.randn(6 * n + 1, 5, dtype=ht.float64)
+        k = 4
+
+        for metric, dense in [("euclidean", ht.spatial.cdist), ("manhattan", ht.spatial.manhattan)]:
+            expected_distances = torch.topk(dense(X, Y).larray, k, dim=1, largest=False)[0]
+            for x_split in [None, 0]:
+                for y_split in [None, 0]:
+                    for block_size in [2**24, 7]:
+                        distances, indices = ht.spatial.cdist_topk(
+                            ht.resplit(X, x_split),
+                            ht.resplit(Y, y_split),
+                            k,
+                            metric=metric,
+                            block_size=block_size,
+                        )
+                        self.assertEqual(distances.shape, (X.shape[0], k))
+                        self.assertEqual(indices.shape, (X.shape[0], k))
+                        self.assertEqual(distances.split, x_split)
+                        self.assertEqual(indices.split, x_split)
+                        self.assertEqual(indices.dtype, ht.int64)
+                        distances = ht.resplit(distances, None).larray
+                        indices = ht.resplit(indices, None).larray
+                        self.assertTrue(torch.allclose(distances, expected_distances))
+                        # the indices point to rows of Y with the returned distances
+                        recomputed = dense(X, Y).larray.gather(1, indices)
+                        self.assertTrue(torch.allclose(recomputed, distances))
+
+        # neighbors within X itself, each row is its own nearest neighbor
+        distances, indices = ht.spatial.cdist_topk(ht.resplit(X, 0), k=1, block_size=5)
+        self.assertTrue(ht.equal(indices.squeeze(1), ht.arange(X.shape[0], split=0)))
+        self.assertTrue(ht.allclose(distances, ht.zeros_like(distances)))
+
+        # integer inputs are promoted
+        distances, _ = ht.spatial.cdist_topk(ht.arange(6, split=0).reshape((3, 2)), k=2)
+        self.assertEqual(distances.dtype, ht.float32)
+
+        # custom metric
+        distances, _ = ht.spatial.cdist_topk(X, Y, k, metric=lambda x, y: torch.cdist(x, y) ** 2)
+        expected = torch.topk(ht.spatial.cdist(X, Y).larray, k, dim=1, largest=False)[0] ** 2
+        self.assertTrue(torch.allclose(distances.larray, expected))
+
+        with self.assertRaises(ValueError):
+            ht.spatial.cdist_topk(X, Y, Y.shape[0] + 1)
+        with self.assertRaises(ValueError):
+            ht.spatial.cdist_topk(X, Y, k, metric="cosine")
+        with self.assertRaises(ValueError):
+            ht.spatial.cdist_topk(X, Y[:, :2], k)
+        with self.assertRaises(NotImplementedError):
+            ht.spatial.cdist_topk(ht.resplit(X, 1), Y, k)
+        with self.assertRaises(NotImplementedError):
+            ht.spatial.cdist_topk(ht.zeros((2, 2, 2)), k=1)
@@ -2,9 +2,10 @@
 Function and classes useful for loading data into neural networks
 """
 
+import numpy as np
 import torch
 from torch.utils import data as torch_data
-from typing import Callable, List, Iterator, Union, Optional, Sized
+from typing import Callable, List, Iterator, Union, Optional, Sized, Tuple
 
 from ...core.dndarray import DNDarray
 from ...core.communication import MPI_WORLD
@@ -130,15 +131,16 @@ class DataLoader:
                 # shuffle after the first epoch but before the iterator is generated
                 self.dataset.Shuffle()
         else:
-            # start the shuffling for the next iteration
-            if not self.last_epoch:
-                self.dataset.Ishuffle()
-
+            # finish the shuffling started during the previous iteration
             if self._first_iter:
                 self._first_iter = False
             else:
                 dataset_irecv(self.dataset)
 
+            # start the shuffling for the next iteration, it overlaps with the current one
+            if not self.last_epoch:
+                self.dataset.Ishuffle()
+
 
 class Dataset(torch_data.Dataset):
     r"""
@@ -228,25 +230,95 @@ class Dataset(torch_data.Dataset):
 
     def Shuffle(self):
         """
-        Send half of the local data to the process ``self.comm.rank + 1`` if available, else wrap around. After
-        receiving the new data, shuffle the local tensor.
+        Shuffle the data globally across all processes, see :func:`dataset_shuffle`.
         """
         if not self.test_set:
             dataset_shuffle(dataset=self, attrs=[["data", "htdata"]])
 
     def Ishuffle(self):
         """
-        Send half of the local data to the process ``self.comm.rank + 1`` if available, else wrap around. After
-        receiving the new data, shuffle the local tensor.
+        Start a non-blocking global shuffle of the data across all processes, see :func:`dataset_ishuffle`.
         """
         if not self.test_set:
             dataset_ishuffle(dataset=self, attrs=[["data", "htdata"]])
 
 
-def dataset_shuffle(dataset: Union[Dataset, torch_data.Dataset], attrs: List[list]):
+def _shuffle_plan(
+    comm, n_local: int, seed: Optional[int] = None
+) -> Tuple[torch.Tensor, List[int], List[int], List[int], List[int], torch.Tensor]:
+    """
+    Plan a uniformly random global permutation of the rows of a dataset that is distributed along its first axis.
+    The number of rows on each process is kept constant.
+
+    The permutation is realised in three steps. First, a ``size x size`` contingency table is drawn, whose entry
+    ``(i, j)`` holds the number of rows process ``i`` sends to process ``j``. The table is sampled from the
+    multivariate hypergeometric distribution with a seed shared by all processes, i.e. every process computes the
+    same table without further communication. Second, each process shuffles its rows locally and sends contiguous
+    chunks of them to the target processes. Third, the received rows are shuffled locally again. This yields a
+    uniformly random global permutation while the communication volume is a single ``Alltoallv`` per attribute.
+
+    Parameters
+    ----------
+    comm : MPICommunication
+        The communicator of the dataset
+    n_local : int
+        Number of rows on this process
+    seed : int, optional
+        Seed of the global permutation. If ``None``, it is drawn from the torch random number generator of process 0.
+
+    Returns
+    -------
+    (send_perm, send_counts, send_displs, recv_counts, recv_displs, recv_perm)
+    """
+    if seed is None:
+        seed = int(torch.randint(0, 2**31 - 1, (1,)).item())
+    # a single collective gathers the row counts of all processes and agrees on a common seed
+    gathered = comm.allgather((n_local, seed))
+    counts = np.array([cnt for cnt, _ in gathered], dtype=np.int64)
+    seed = gathered[0][1]
+
+    # every process draws the same contingency table of rows sent from process i to process j
+    rng = np.random.default_rng(seed)
+    remaining = counts.copy()
+    table = np.zeros((comm.size, comm.size), dtype=np.int64)
+    for i in range(comm.size - 1):
+        table[i] = rng.multivariate_hypergeometric(remaining, counts[i])
+        remaining -= table[i]
+    table[-1] = remaining
+
+    send_counts = table[comm.rank].tolist()
+    send_displs = [0] + np.cumsum(send_counts[:-1]).tolist()
+    recv_counts = table[:, comm.rank].tolist()
+    recv_displs = [0] + np.cumsum(recv_counts[:-1]).tolist()
+
+    # the local shuffles are independent on each process
+    gen = torch.Generator().manual_seed(seed + comm.rank + 1)
+    send_perm = torch.randperm(n_local, generator=gen)
+    recv_perm = torch.randperm(n_local, generator=gen)
+
+    return send_perm, send_counts, send_displs, recv_counts, recv_displs, recv_perm
+
+
+def _local_shuffle_tensor(
+    dataset: Union[Dataset, torch_data.Dataset], att: List[Union[str, None]]
+) -> torch.Tensor:
+    """
+    Get the process-local torch tensor which is shuffled for the attribute pair ``att``. This is the local tensor of
+    the DNDarray if it is given, otherwise the torch tensor attribute itself.
+    """
+    if att[1] is not None:
+        return getattr(dataset, att[1])._DNDarray__array
+    return getattr(dataset, att[0])
+
+
+def dataset_shuffle(
+    dataset: Union[Dataset, torch_data.Dataset], attrs: List[list], seed: Optional[int] = None
+):
     """
-    Shuffle the given attributes of a dataset across multiple processes. This will send half of the data to rank + 1.
-    Once the new data is received, it will be shuffled into the existing data on the process.
+    Shuffle the given attributes of a dataset across multiple processes. The local data is permuted with a global,
+    uniformly random permutation, i.e. every data element can move to any process in a single call. The number of
+    elements on each process does not change. Each attribute is exchanged with a single ``Alltoallv`` and the result is
+    written into the existing torch storage of the attribute.
     This function will be called by the DataLoader automatically if ``dataset.ishuffle = False``.
     attrs should have the form [[torch.Tensor, DNDarray], ... i.e. [['data', 'htdata`]] assume that all of the attrs have the same dim0 shape as the local data
 
@@ -259,49 +331,41 @@ def dataset_shuffle(dataset: Union[Dataset, torch_data.Dataset], attrs: List[lis
         attributes corresponding to the global data DNDarray and the local data of that array, i.e. [["data, "htdata"],]
         would shuffle the htdata around and set the correct amount of data for the ``dataset.data`` attribute. For
         multiple parameters multiple lists are required. I.e. [["data", "htdata"], ["targets", "httargets"]]
+    seed : int, optional
+        Seed for the global permutation. If ``None`` (default), the seed is drawn from the torch random number
+        generator of process 0.
 
     Notes
     -----
     ``dataset.comm`` must be defined for this function to work.
     """
     # attrs -> [[torch.Tensor, DNDarray], ...]
-    if attrs[0][1] is not None:
-        prm = torch.randperm(getattr(dataset, attrs[0][1])._DNDarray__array.shape[0])
-    else:
-        prm = torch.randperm(getattr(dataset, attrs[0][0]).shape[0])
     comm = dataset.comm
+    n_local = _local_shuffle_tensor(dataset, attrs[0]).shape[0]
+    send_perm, send_counts, send_displs, recv_counts, recv_displs, recv_perm = _shuffle_plan(
+        comm, n_local, seed
+    )
     for att in attrs:
-        ld = getattr(dataset, att[0])
-        snd = ld[: dataset.lcl_half].clone()
-        snd_shape, snd_dtype, snd_dev = snd.shape, snd.dtype, snd.device
-        dest = comm.rank + 1 if comm.rank + 1 != comm.size else 0
-        # send the top half of the data to the next process
-        send_wait = comm.Isend(snd, dest=dest)
+        ld = _local_shuffle_tensor(dataset, att)
+        snd = ld[send_perm.to(ld.device)]
+        # receive straight into the existing storage
+        comm.Alltoallv((snd, send_counts, send_displs), (ld, recv_counts, recv_displs))
         del snd
-        new_data = torch.empty(snd_shape, dtype=snd_dtype, device=snd_dev)
-        src = comm.rank - 1 if comm.rank != 0 else comm.size - 1
-        rcv_w = comm.Irecv(new_data, source=src)
-        send_wait.wait()
-        rcv_w.wait()
-        # set the DNDarray data
+        # mix the received blocks locally
+        ld.copy_(ld[recv_perm.to(ld.device)])
         if att[1] is not None:
-            getattr(dataset, att[1])._DNDarray__array[: dataset.lcl_half] = new_data
-            # shuffle all of the data around
-            shuffled = getattr(dataset, att[1])._DNDarray__array[prm]
-            getattr(dataset, att[1])._DNDarray__array = shuffled
             # set the torch data
-            setattr(dataset, att[0], shuffled[dataset._cut_slice])
-        else:
-            getattr(dataset, att[0])[: dataset.lcl_half] = new_data
-            # shuffle all of the data around
-            shuffled = getattr(dataset, att[0])[prm]
-            setattr(dataset, att[0], shuffled[dataset._cut_slice])
+            setattr(dataset, att[0], ld[dataset._cut_slice])
 
 
-def dataset_ishuffle(dataset: Union[Dataset, torch_data.Dataset], attrs: List[list]):
+def dataset_ishuffle(
+    dataset: Union[Dataset, torch_data.Dataset], attrs: List[list], seed: Optional[int] = None
+):
     """
     Shuffle the given attributes of a dataset across multiple processes, using non-blocking communications.
-    This will send half of the data to rank + 1. The data must be received by the :func:`dataset_irecv` function.
+    This is the non-blocking version of :func:`dataset_shuffle`, i.e. the data is permuted globally with one
+    ``Ialltoallv`` per attribute. The current local data stays untouched until the data is received by the
+    :func:`dataset_irecv` function, hence the communication can overlap with an epoch on the current data.
 
     This function will be called by the DataLoader automatically if ``dataset.ishuffle = True``. This is set either
     during the definition of the class of its initialization by a given paramete.
@@ -315,6 +379,9 @@ def dataset_ishuffle(dataset: Union[Dataset, torch_data.Dataset], attrs: List[li
         attributes corresponding to the global data DNDarray and the local data of that array, i.e. [["htdata, "data"],]
         would shuffle the htdata around and set the correct amount of data for the ``dataset.data`` attribute. For
         multiple parameters multiple lists are required. I.e. [["htdata", "data"], ["httargets", "targets"]]
+    seed : int, optional
+        Seed for the global permutation. If ``None`` (default), the seed is drawn from the torch random number
+        generator of process 0.
 
     Notes
     -----
@@ -324,26 +391,28 @@ def dataset_ishuffle(dataset: Union[Dataset, torch_data.Dataset], attrs: List[li
     #       i.e. [['data', 'htdata']]
     # assume that all of the attrs have the same dim0 shape as the local data
     comm = dataset.comm
+    n_local = _local_shuffle_tensor(dataset, attrs[0]).shape[0]
+    send_perm, send_counts, send_displs, recv_counts, recv_displs, recv_perm = _shuffle_plan(
+        comm, n_local, seed
+    )
     ret_list = []
     for att in attrs:
-        snd = getattr(dataset, att[0])[: dataset.lcl_half].clone()
-        snd_shape, snd_dtype, snd_dev = snd.shape, snd.dtype, snd.device
-        dest = comm.rank + 1 if comm.rank + 1 != comm.size else 0
-        # send the top half of the data to the next process
-        send_wait = comm.Isend(snd, dest=dest, tag=99999)
-        new_data = torch.empty(snd_shape, dtype=snd_dtype, device=snd_dev)
-        src = comm.rank - 1 if comm.rank != 0 else comm.size - 1
-        wait = comm.Irecv(new_data, source=src, tag=99999)
-        ret_list.append([att, wait, new_data])
-        send_wait.wait()
-        del snd
+        ld = _local_shuffle_tensor(dataset, att)
+        snd = ld[send_perm.to(ld.device)]
+        new_data = torch.empty_like(ld, memory_format=torch.contiguous_format)
+        wait = comm.Ialltoallv(
+            (snd, send_counts, send_displs), (new_data, recv_counts, recv_displs)
+        )
+        # the send buffer has to be kept alive until the communication is finished
+        ret_list.append([att, wait, new_data, snd])
     setattr(dataset, "rcv_list", ret_list)
+    setattr(dataset, "shuffle_prm", recv_perm)
 
 
 def dataset_irecv(dataset: Union[Dataset, torch_data.Dataset]):
     """
     Receive the data sent by the :func:`dataset_ishuffle` function. This will wait for the data and then shuffle the
-    data into the existing data on the process
+    data into the existing storage of the local data on the process
 
     This function will be called by the DataLoader automatically if ``dataset.ishuffle = True``. This is set either
     during the definition of the class of its initialization by a given paramete.
@@ -357,20 +426,14 @@ def dataset_irecv(dataset: Union[Dataset, torch_data.Dataset]):
     -----
     ``dataset.comm`` must be defined for this function to work.
     """
-    setattr(dataset, "shuffle_prm", torch.randperm(dataset.data.shape[0]))
     rcv_list = getattr(dataset, "rcv_list")
     prm = getattr(dataset, "shuffle_prm")
     for rcv in rcv_list:
-        rcv[1].wait()
+        rcv[1].Wait()
+        ld = _local_shuffle_tensor(dataset, rcv[0])
+        # scatter the received data into the existing storage, this shuffles it locally
+        ld.index_copy_(0, prm.to(ld.device), rcv[2])
         if rcv[0][1] is not None:
-            getattr(dataset, rcv[0][1])._DNDarray__array[: dataset.lcl_half] = rcv[2]
-            # shuffle all of the data around
-            shuffled = getattr(dataset, rcv[0][1])._DNDarray__array[prm]
-            getattr(dataset, rcv[0][1])._DNDarray__array = shuffled
             # set the torch data
-            setattr(dataset, rcv[0][0], shuffled[dataset._cut_slice])
-        else:
-            getattr(dataset, rcv[0][0])[: dataset.lcl_half] = rcv[2]
-            # shuffle all of the data around
-            shuffled = getattr(dataset, rcv[0][0])[prm]
-            setattr(dataset, rcv[0][0], shuffled[dataset._cut_slice])
+            setattr(dataset, rcv[0][0], ld[dataset._cut_slice])
+    setattr(dataset, "rcv_list", [])
@@ -0,0 +1,70 @@
+import torch
+
+import heat as ht
+from heat.core.tests.test_suites.basic_test import TestCase
+
+
+class TestDatatools(TestCase):
+    def test_dataset_shuffle(self):
+        class TestDataset(ht.utils.data.Dataset):
+            def __init__(self, array, targets, ishuffle):
+                super(TestDataset, self).__init__(array, ishuffle=ishuffle)
+                self.httargets = targets
+                self.targets = targets.larray[self._cut_slice]
+
+            def Shuffle(self):
+                ht.utils.data.dataset_shuffle(
+                    self, attrs=[["data", "htdata"], ["targets", "httargets"]]
+                )
+
+            def Ishuffle(self):
+                ht.utils.data.dataset_ishuffle(
+                    self, attrs=[["data", "htdata"], ["targets", "httargets"]]
+                )
+
+        n = 7 * ht.MPI_WORLD.size + 3
+        targets = ht.arange(n, dtype=ht.int64, split=0).expand_dims(1)
+        data = ht.hstack([targets, 2 * targets]).astype(ht.float32)
+        expected = torch.arange(n, device=targets.device.torch_device).unsqueeze(1)
+
+        for ishuffle in [False, True]:
+            dataset = TestDataset(data.copy(), targets.copy(), ishuffle=ishuffle)
+            lshape = dataset.htdata.lshape
+            storage = dataset.htdata.larray.data_ptr()
+            for _ in range(3):
+                if ishuffle:
+                    dataset.Ishuffle()
+                    ht.utils.data.datatools.dataset_irecv(dataset)
+                else:
+                    dataset.Shuffle()
+                # local shapes and the torch storage are kept
+                self.assertEqual(dataset.htdata.lshape, lshape)
+                self.assertEqual(dataset.htdata.larray.data_ptr(), storage)
+                self.assertEqual(dataset.data.data_ptr(), storage)
+                # data and targets are permuted alike
+                self.assertTrue(torch.equal(dataset.data[:, :1].to(torch.int64), dataset.targets))
+                self.assertTrue(
+                    torch.equal(
+                        dataset.htdata.larray[:, 1:].to(torch.int64), 2 * dataset.httargets.larray
+                    )
+                )
+                # all elements are still there
+                gathered = ht.resplit(dataset.httargets, None).larray
+                self.assertTrue(torch.equal(gathered.sort(dim=0)[0], expected))
+
+        # the shuffle is reproducible for a given seed
+        dataset = TestDataset(data.copy(), targets.copy(), ishuffle=False)
+        other = TestDataset(data.copy(), targets.copy(), ishuffle=False)
+        ht.utils.data.dataset_shuffle(dataset, attrs=[["targets", "httargets"]], seed=42)
+        ht.utils.data.dataset_shuffle(other, attrs=[["targets", "httargets"]], seed=42)
+        self.assertTrue(torch.equal(dataset.targets, other.targets))
+
+        # torch-only attributes
+        local = torch.arange(10, dtype=torch.float32)
+        dataset = TestDataset(data.copy(), targets.copy(), ishuffle=False)
+        dataset.data = local.clone()
+        ht.utils.data.dataset_shuffle(dataset, attrs=[["data", None]])
+        self.assertEqual(dataset.data.shape, local.shape)
+        total = torch.tensor(dataset.data.sum().item())
+        ht.MPI_WORLD.Allreduce(ht.MPI.IN_PLACE, total, ht.MPI.SUM)
+        self.assertEqual(total.item(), 45.0 * ht.MPI_WORLD.size)